@@ -1,5 +1,10 @@
 """Event deduplication logic using fuzzy matching."""
-from fuzzywuzzy import fuzz
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+from rapidfuzz import fuzz, process
 from models import Event
 from datetime import datetime
 
@@ -17,58 +22,83 @@ def deduplicate_events(events: list[Event], similarity_threshold: int = 80) -> l
     if not events:
         return []
 
-    deduplicated = []
-    seen_keys = set()
-
+    # Only events on the same date can be duplicates. Exact repeats of a
+    # normalized title collapse here by key, so the fuzzy pass sees each title once.
+    buckets: dict[str, dict[str, Event]] = defaultdict(dict)
     for event in events:
-        # Create a normalized key for exact matching
-        normalized_title = normalize_title(event.title)
-        date_key = event.dateStart
-        exact_key = f"{normalized_title}:{date_key}"
-
-        # Check for exact duplicates first
-        if exact_key in seen_keys:
-            continue
-
-        # Check for fuzzy duplicates
-        is_duplicate = False
-        for existing in deduplicated:
-            # Only compare events on the same date
-            if existing.dateStart != event.dateStart:
-                continue
-
-            # Calculate title similarity
-            similarity = fuzz.ratio(normalized_title, normalize_title(existing.title))
-
-            if similarity >= similarity_threshold:
-                is_duplicate = True
-                # Keep the one with more information (longer description)
-                if event.description and len(event.description) > len(existing.description or ""):
-                    deduplicated.remove(existing)
-                    deduplicated.append(event)
-                    seen_keys.add(exact_key)
-                break
-
-        if not is_duplicate:
-            deduplicated.append(event)
-            seen_keys.add(exact_key)
+        titles = buckets[event.dateStart]
+        normalized = normalize_title(event.title)
+        existing = titles.get(normalized)
+        # Keep the one with more information (longer description)
+        if existing is None or len(event.description or "") > len(existing.description or ""):
+            titles[normalized] = event
+
+    deduplicated = []
+    for bucket in buckets.values():
+        deduplicated.extend(_deduplicate_bucket(bucket, similarity_threshold))
 
     return deduplicated
 
+def _deduplicate_bucket(titles: dict[str, Event], similarity_threshold: int) -> list[Event]:
+    """Collapse similar titles within a single date into one event each."""
+    bucket = list(titles.values())
+    if len(bucket) == 1:
+        return bucket
+
+    normalized = list(titles)
+
+    # Pairwise similarity matrix; scores below the threshold come back as 0
+    scores = process.cdist(
+        normalized,
+        normalized,
+        scorer=fuzz.ratio,
+        score_cutoff=similarity_threshold,
+        dtype=np.uint8,
+        workers=-1,
+    )
+
+    # Union-find over the upper triangle groups transitive duplicates
+    parent = list(range(len(bucket)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(*np.nonzero(np.triu(scores, k=1))):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    # Keep the one with more information (longer description) per group,
+    # tracked as (index, description length) so nothing is searched or re-measured
+    best: dict[int, tuple[int, int]] = {}
+    for i, event in enumerate(bucket):
+        root = find(i)
+        length = len(event.description or "")
+        if root not in best or length > best[root][1]:
+            best[root] = (i, length)
+
+    return [bucket[i] for i, _ in sorted(best.values())]
+
+# Common prefixes/suffixes stripped before comparing titles
+REMOVE_PHRASES = (
+    "free:", "free ", "sold out:", "sold out ",
+    "cancelled:", "cancelled ", "postponed:",
+    "- seattle", "| seattle", "(seattle)",
+    "- wa", "| wa",
+)
+REMOVE_PHRASES_PATTERN = re.compile("|".join(map(re.escape, REMOVE_PHRASES)))
+
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
-    """Normalize event title for comparison."""
+    """Normalize event title for comparison (cached - sources repeat titles every refresh)."""
     # Lowercase
     normalized = title.lower()
 
-    # Remove common prefixes/suffixes
-    remove_phrases = [
-        "free:", "free ", "sold out:", "sold out ",
-        "cancelled:", "cancelled ", "postponed:",
-        "- seattle", "| seattle", "(seattle)",
-        "- wa", "| wa",
-    ]
-    for phrase in remove_phrases:
-        normalized = normalized.replace(phrase, "")
+    # Remove common prefixes/suffixes in a single pass
+    normalized = REMOVE_PHRASES_PATTERN.sub("", normalized)
 
     # Remove extra whitespace
     normalized = " ".join(normalized.split())
@@ -1,12 +1,20 @@
 # Content detectors for unified analysis
 from .haiku import detect_haiku, HaikuResult
-from .farewell import detect_farewell, detect_political_complaint, FarewellResult, PoliticalComplaintResult
-from .crosslink import detect_crosslinks, CrosslinkResult
-from .tone import classify_tone, ToneResult
+from .farewell import (
+    detect_farewell, detect_farewell_batch,
+    detect_political_complaint, detect_political_complaint_batch,
+    detect_farewell_and_political,
+    FarewellResult, PoliticalComplaintResult,
+)
+from .crosslink import detect_crosslinks, detect_crosslinks_batch, CrosslinkResult
+from .tone import classify_tone, classify_tone_batch, ToneResult
 
 __all__ = [
     'detect_haiku', 'HaikuResult',
-    'detect_farewell', 'detect_political_complaint', 'FarewellResult', 'PoliticalComplaintResult',
-    'detect_crosslinks', 'CrosslinkResult',
-    'classify_tone', 'ToneResult',
+    'detect_farewell', 'detect_farewell_batch',
+    'detect_political_complaint', 'detect_political_complaint_batch',
+    'detect_farewell_and_political',
+    'FarewellResult', 'PoliticalComplaintResult',
+    'detect_crosslinks', 'detect_crosslinks_batch', 'CrosslinkResult',
+    'classify_tone', 'classify_tone_batch', 'ToneResult',
 ]
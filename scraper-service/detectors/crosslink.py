@@ -3,7 +3,7 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class CrosslinkMatch:
     subreddit: str
     full_url: str
@@ -11,7 +11,7 @@ class CrosslinkMatch:
     comment_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CrosslinkResult:
     detected: bool
     links: list[CrosslinkMatch] = None
@@ -21,15 +21,18 @@ class CrosslinkResult:
             self.links = []
 
 
-# Reddit URL patterns
-REDDIT_LINK_PATTERNS = [
+# Reddit URL patterns fused into one alternation so the text is scanned once;
+# the outer named group (full / short / mention) tells which form matched
+REDDIT_LINK_PATTERN = re.compile(
     # Full URLs: https://reddit.com/r/subreddit/comments/id/title
-    re.compile(r'https?://(?:www\.)?(?:old\.)?reddit\.com/r/([a-zA-Z0-9_]+)(?:/comments/([a-z0-9]+))?(?:/[^/\s]*)?(?:/([a-z0-9]+))?', re.I),
+    r'(?P<full>https?://(?:www\.)?(?:old\.)?reddit\.com/r/(?P<subreddit>[a-zA-Z0-9_]+)'
+    r'(?:/comments/(?P<post_id>[a-z0-9]+))?(?:/[^/\s]*)?(?:/(?P<comment_id>[a-z0-9]+))?)'
     # Short URLs: https://redd.it/id
-    re.compile(r'https?://redd\.it/([a-z0-9]+)', re.I),
+    r'|(?P<short>https?://redd\.it/(?P<short_id>[a-z0-9]+))'
     # Subreddit mentions: r/subreddit
-    re.compile(r'(?<![/\w])r/([a-zA-Z0-9_]{2,21})(?![/\w])', re.I),
-]
+    r'|(?P<mention>(?<![/\w])r/(?P<mention_subreddit>[a-zA-Z0-9_]{2,21})(?![/\w]))',
+    re.I,
+)
 
 
 def detect_crosslinks(text: str, exclude_subreddit: Optional[str] = None) -> CrosslinkResult:
@@ -41,51 +44,60 @@ def detect_crosslinks(text: str, exclude_subreddit: Optional[str] = None) -> Cro
         exclude_subreddit: Subreddit to exclude (e.g., the source subreddit)
     """
     links = []
-    seen_urls = set()
+    seen_urls = set()  # Lowercased, so case variants of one URL count once
+    seen_subreddits = set()  # Lowercased subreddit of every link added so far
+
+    # Single scan, grouped by form so full URLs still take precedence over mentions
+    matches: dict[str, list[re.Match]] = {'full': [], 'short': [], 'mention': []}
+    for match in REDDIT_LINK_PATTERN.finditer(text):
+        matches[match.lastgroup].append(match)
 
     # Full Reddit URLs
-    for match in REDDIT_LINK_PATTERNS[0].finditer(text):
-        subreddit = match.group(1)
-        post_id = match.group(2) if match.lastindex >= 2 else None
-        comment_id = match.group(3) if match.lastindex >= 3 else None
+    for match in matches['full']:
+        subreddit = match.group('subreddit')
         full_url = match.group(0)
 
         if exclude_subreddit and subreddit.lower() == exclude_subreddit.lower():
             continue
 
-        if full_url not in seen_urls:
-            seen_urls.add(full_url)
+        url_key = full_url.lower()
+        if url_key not in seen_urls:
+            seen_urls.add(url_key)
+            seen_subreddits.add(subreddit.lower())
             links.append(CrosslinkMatch(
                 subreddit=subreddit,
                 full_url=full_url,
-                post_id=post_id,
-                comment_id=comment_id,
+                post_id=match.group('post_id'),
+                comment_id=match.group('comment_id'),
             ))
 
     # Short URLs (redd.it)
-    for match in REDDIT_LINK_PATTERNS[1].finditer(text):
-        post_id = match.group(1)
+    for match in matches['short']:
         full_url = match.group(0)
 
-        if full_url not in seen_urls:
-            seen_urls.add(full_url)
+        url_key = full_url.lower()
+        if url_key not in seen_urls:
+            seen_urls.add(url_key)
+            seen_subreddits.add('unknown')
             links.append(CrosslinkMatch(
                 subreddit='unknown',  # Can't determine from short URL
                 full_url=full_url,
-                post_id=post_id,
+                post_id=match.group('short_id'),
             ))
 
     # Subreddit mentions (r/subreddit)
-    for match in REDDIT_LINK_PATTERNS[2].finditer(text):
-        subreddit = match.group(1)
+    for match in matches['mention']:
+        subreddit = match.group('mention_subreddit')
         full_url = f"https://reddit.com/r/{subreddit}"
 
         if exclude_subreddit and subreddit.lower() == exclude_subreddit.lower():
             continue
 
         # Don't duplicate if we already have a full URL for this subreddit
-        if full_url not in seen_urls and not any(l.subreddit.lower() == subreddit.lower() for l in links):
-            seen_urls.add(full_url)
+        url_key = full_url.lower()
+        if url_key not in seen_urls and subreddit.lower() not in seen_subreddits:
+            seen_urls.add(url_key)
+            seen_subreddits.add(subreddit.lower())
             links.append(CrosslinkMatch(
                 subreddit=subreddit,
                 full_url=full_url,
@@ -101,3 +113,8 @@ def get_external_subreddit_links(text: str, source_subreddit: str) -> list[Cross
     """Get links to subreddits other than the source."""
     result = detect_crosslinks(text, exclude_subreddit=source_subreddit)
     return result.links
+
+
+def detect_crosslinks_batch(texts: list[str], exclude_subreddit: Optional[str] = None) -> list[CrosslinkResult]:
+    """Run crosslink detection over many texts (e.g. a whole scrape), aligned with the input."""
+    return [detect_crosslinks(text, exclude_subreddit=exclude_subreddit) for text in texts]
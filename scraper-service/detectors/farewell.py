@@ -1,9 +1,17 @@
 """Farewell/unsubscribe detection - finds posts announcing departure from subreddit."""
 import re
+import threading
 from dataclasses import dataclass
 from typing import Optional, Literal
 
-@dataclass
+import ahocorasick
+
+try:
+    import hyperscan
+except ImportError:  # Optional (x86-64 only) - falls back to the re unions below
+    hyperscan = None
+
+@dataclass(slots=True)
 class FarewellResult:
     detected: bool
     confidence: float = 0.0
@@ -14,7 +22,7 @@ class FarewellResult:
             self.matched_patterns = []
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliticalComplaintResult:
     detected: bool
     complaint_type: Optional[Literal['right-leaning', 'left-leaning', 'general']] = None
@@ -82,42 +90,162 @@ POLITICAL_COMPLAINT_PATTERNS = [
     re.compile(r"all (you )?(people|guys|everyone) (here )?(are|vote) (the same|republican|democrat|trump|liberal)", re.I),
 ]
 
-# Quick filter keywords
+# Which way a political complaint says the sub leans; right-leaning wins if both appear
+RIGHT_LEANING_PATTERN = re.compile(r'trump|maga|conservative|right.?wing|republican')
+LEFT_LEANING_PATTERN = re.compile(r'leftist|liberal|progressive|democrat')
+
+# Quick filter keywords - every UNSUBSCRIBE_PATTERNS match contains at least
+# one of these, so detect_farewell can safely skip texts that have none
 QUICK_FILTER_KEYWORDS = [
     'unsubscrib',
+    'unsubbing',
     'leaving',
     'leave',
     'goodbye',
     'farewell',
+    'adios',
+    'so long',
+    'peace out',
     'done with',
+    "that's it",
     'quit',
     'toxic',
-    'echo chamber',
-    'circlejerk',
+    'shit',
+    'trash',
+    'garbage',
+    'echo',
+    'jerk',
+    'hive',
+    'used to',
+    'was good',
+    'was great',
+    'was better',
+    'anymore',
+    'gone',
+    'outta here',
     "i'm out",
     'im out',
+    'am out',
+    'to out',
 ]
 
 
-def could_be_farewell(text: str) -> bool:
+def _build_automaton(keywords: list[str]) -> ahocorasick.Automaton:
+    """Compile keywords into an Aho-Corasick automaton so text is scanned once."""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+QUICK_FILTER_AUTOMATON = _build_automaton(QUICK_FILTER_KEYWORDS)
+CONTEXT_AUTOMATON = _build_automaton(CONTEXT_KEYWORDS)
+
+
+def _build_union(patterns: list[re.Pattern]) -> re.Pattern:
+    """Fuse patterns into one alternation, one named group (p0, p1, ...) per pattern."""
+    return re.compile('|'.join(f'(?P<p{i}>{p.pattern})' for i, p in enumerate(patterns)), re.I)
+
+
+UNSUBSCRIBE_UNION = _build_union(UNSUBSCRIBE_PATTERNS)
+NEGATIVE_UNION = _build_union(NEGATIVE_PATTERNS)
+POLITICAL_COMPLAINT_UNION = _build_union(POLITICAL_COMPLAINT_PATTERNS)
+
+
+def _build_database(patterns: list[re.Pattern]):
+    """Compile patterns into one Hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[p.pattern.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(patterns),
+        )
+        return database
+    except hyperscan.error:
+        return None
+
+
+_thread_local = threading.local()
+
+
+def _scratch_for(database):
+    """Scratch space can't be shared by concurrent scans, so keep one per thread and database."""
+    scratches = getattr(_thread_local, 'scratches', None)
+    if scratches is None:
+        scratches = _thread_local.scratches = {}
+    scratch = scratches.get(id(database))
+    if scratch is None:
+        scratch = scratches[id(database)] = hyperscan.Scratch(database)
+    return scratch
+
+
+def _scan(database, text: str) -> set[int]:
+    """Return the index of every pattern in the database that matches text."""
+    ids: set[int] = set()
+    database.scan(
+        text.encode('utf-8', 'ignore'),
+        match_event_handler=lambda id, start, end, flags, context: ids.add(id),
+        scratch=_scratch_for(database),
+    )
+    return ids
+
+
+UNSUBSCRIBE_DB = _build_database(UNSUBSCRIBE_PATTERNS)
+NEGATIVE_DB = _build_database(NEGATIVE_PATTERNS)
+POLITICAL_COMPLAINT_DB = _build_database(POLITICAL_COMPLAINT_PATTERNS)
+
+# All three pattern sets in one database, for callers that want both results from one pass.
+# Ids are offsets into this concatenation.
+_NEGATIVE_OFFSET = len(UNSUBSCRIBE_PATTERNS)
+_POLITICAL_OFFSET = _NEGATIVE_OFFSET + len(NEGATIVE_PATTERNS)
+COMBINED_DB = _build_database(UNSUBSCRIBE_PATTERNS + NEGATIVE_PATTERNS + POLITICAL_COMPLAINT_PATTERNS)
+
+
+def could_be_farewell(text: str, lower_text: Optional[str] = None) -> bool:
     """Quick pre-filter to avoid running regex on every post."""
-    lower_text = text.lower()
-    return any(kw in lower_text for kw in QUICK_FILTER_KEYWORDS)
+    if lower_text is None:
+        lower_text = text.lower()
+    return next(QUICK_FILTER_AUTOMATON.iter(lower_text), None) is not None
+
+
+def detect_farewell(text: str, lower_text: Optional[str] = None) -> FarewellResult:
+    """
+    Detect if text is an unsubscribe announcement.
+    Pass lower_text when the caller already has text.lower(), to avoid recomputing it.
+    """
+    if lower_text is None:
+        lower_text = text.lower()
+
+    if not could_be_farewell(text, lower_text):
+        return FarewellResult(detected=False)
 
+    if UNSUBSCRIBE_DB and NEGATIVE_DB:
+        # Hyperscan reports every matching pattern from a single pass
+        if _scan(NEGATIVE_DB, text):
+            return FarewellResult(detected=False)
+        matched_patterns = [UNSUBSCRIBE_PATTERNS[i].pattern for i in sorted(_scan(UNSUBSCRIBE_DB, text))]
+    else:
+        # Check negative patterns first
+        if NEGATIVE_UNION.search(text):
+            return FarewellResult(detected=False)
 
-def detect_farewell(text: str) -> FarewellResult:
-    """Detect if text is an unsubscribe announcement."""
-    # Check negative patterns first
-    for pattern in NEGATIVE_PATTERNS:
-        if pattern.search(text):
+        # One pass over the text rejects the common no-match case; only on a hit
+        # do we check each pattern, since overlapping matches are hidden by the union
+        if not UNSUBSCRIBE_UNION.search(text):
             return FarewellResult(detected=False)
 
-    # Check main patterns
-    matched_patterns = []
-    for pattern in UNSUBSCRIBE_PATTERNS:
-        if pattern.search(text):
-            matched_patterns.append(pattern.pattern)
+        matched_patterns = [p.pattern for p in UNSUBSCRIBE_PATTERNS if p.search(text)]
+
+    return _farewell_result(matched_patterns, lower_text)
 
+
+def _farewell_result(matched_patterns: list[str], lower_text: str) -> FarewellResult:
+    """Score the unsubscribe patterns that matched (after negative patterns were ruled out)."""
     if not matched_patterns:
         return FarewellResult(detected=False)
 
@@ -125,8 +253,7 @@ def detect_farewell(text: str) -> FarewellResult:
     confidence = min(0.5 + len(matched_patterns) * 0.15, 0.8)
 
     # Boost for context keywords
-    lower_text = text.lower()
-    context_matches = sum(1 for kw in CONTEXT_KEYWORDS if kw in lower_text)
+    context_matches = len({kw for _, kw in CONTEXT_AUTOMATON.iter(lower_text)})
     confidence += context_matches * 0.05
 
     # Cap at 0.95
@@ -139,22 +266,77 @@ def detect_farewell(text: str) -> FarewellResult:
     )
 
 
-def detect_political_complaint(text: str) -> PoliticalComplaintResult:
-    """Detect if text contains political/echo chamber complaints."""
-    for pattern in POLITICAL_COMPLAINT_PATTERNS:
-        if pattern.search(text):
-            lower_text = text.lower()
-            complaint_type: Literal['right-leaning', 'left-leaning', 'general'] = 'general'
+def detect_political_complaint(text: str, lower_text: Optional[str] = None) -> PoliticalComplaintResult:
+    """
+    Detect if text contains political/echo chamber complaints.
+    Pass lower_text when the caller already has text.lower(), to avoid recomputing it.
+    """
+    if POLITICAL_COMPLAINT_DB:
+        ids = _scan(POLITICAL_COMPLAINT_DB, text)
+        if not ids:
+            return PoliticalComplaintResult(detected=False)
+        pattern = POLITICAL_COMPLAINT_PATTERNS[min(ids)]
+    else:
+        # The union only rejects the no-match case: it reports the leftmost match, but
+        # the result names the first pattern in list order, as Hyperscan's min(ids) does
+        if not POLITICAL_COMPLAINT_UNION.search(text):
+            return PoliticalComplaintResult(detected=False)
+        pattern = next(p for p in POLITICAL_COMPLAINT_PATTERNS if p.search(text))
+
+    if lower_text is None:
+        lower_text = text.lower()
+    return _political_result(pattern, lower_text)
+
+
+def _political_result(pattern: re.Pattern, lower_text: str) -> PoliticalComplaintResult:
+    """Classify a matched political complaint by which way the poster thinks the sub leans."""
+    complaint_type: Literal['right-leaning', 'left-leaning', 'general'] = 'general'
+
+    if RIGHT_LEANING_PATTERN.search(lower_text):
+        complaint_type = 'right-leaning'  # They think the sub is right-leaning
+    elif LEFT_LEANING_PATTERN.search(lower_text):
+        complaint_type = 'left-leaning'  # They think the sub is left-leaning
+
+    return PoliticalComplaintResult(
+        detected=True,
+        complaint_type=complaint_type,
+        matched_pattern=pattern.pattern,
+    )
+
+
+def detect_farewell_and_political(
+    text: str, lower_text: Optional[str] = None
+) -> tuple[FarewellResult, PoliticalComplaintResult]:
+    """
+    Run detect_farewell and detect_political_complaint together.
+    With Hyperscan this is a single pass over the text for all three pattern sets.
+    """
+    if lower_text is None:
+        lower_text = text.lower()
+
+    if not COMBINED_DB:
+        return detect_farewell(text, lower_text), detect_political_complaint(text, lower_text)
+
+    ids = _scan(COMBINED_DB, text)
+
+    farewell = FarewellResult(detected=False)
+    if could_be_farewell(text, lower_text) and not any(_NEGATIVE_OFFSET <= i < _POLITICAL_OFFSET for i in ids):
+        matched_patterns = [UNSUBSCRIBE_PATTERNS[i].pattern for i in sorted(ids) if i < _NEGATIVE_OFFSET]
+        farewell = _farewell_result(matched_patterns, lower_text)
+
+    political_ids = [i - _POLITICAL_OFFSET for i in ids if i >= _POLITICAL_OFFSET]
+    political = PoliticalComplaintResult(detected=False)
+    if political_ids:
+        political = _political_result(POLITICAL_COMPLAINT_PATTERNS[min(political_ids)], lower_text)
+
+    return farewell, political
+
 
-            if re.search(r'trump|maga|conservative|right.?wing|republican', lower_text):
-                complaint_type = 'right-leaning'  # They think the sub is right-leaning
-            elif re.search(r'leftist|liberal|progressive|democrat', lower_text):
-                complaint_type = 'left-leaning'  # They think the sub is left-leaning
+def detect_farewell_batch(texts: list[str]) -> list[FarewellResult]:
+    """Run farewell detection over many texts (e.g. a whole scrape), aligned with the input."""
+    return [detect_farewell(text) for text in texts]
 
-            return PoliticalComplaintResult(
-                detected=True,
-                complaint_type=complaint_type,
-                matched_pattern=pattern.pattern,
-            )
 
-    return PoliticalComplaintResult(detected=False)
+def detect_political_complaint_batch(texts: list[str]) -> list[PoliticalComplaintResult]:
+    """Run political complaint detection over many texts, aligned with the input."""
+    return [detect_political_complaint(text) for text in texts]
@@ -1,9 +1,12 @@
 """Haiku detection - finds 5-7-5 syllable patterns in text."""
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class HaikuResult:
     detected: bool
     lines: Optional[list[str]] = None  # [line1, line2, line3]
@@ -61,21 +64,26 @@ SYLLABLE_EXCEPTIONS = {
     'fable': 2,
 }
 
+VOWELS = frozenset('aeiouy')
 
+# Punctuation other than hyphens and apostrophes, and "has a letter" checks
+NON_WORD_PATTERN = re.compile(r"[^\w\s'-]")
+LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+
+
+@lru_cache(maxsize=65536)
 def count_syllables(word: str) -> int:
     """Count syllables in a word using heuristics."""
     word = word.lower().strip()
 
-    # Handle empty or non-word input
-    if not word or not re.search(r'[a-z]', word):
-        return 0
-
     # Check exceptions
     if word in SYLLABLE_EXCEPTIONS:
         return SYLLABLE_EXCEPTIONS[word]
 
-    # Remove non-letters
-    word = re.sub(r'[^a-z]', '', word)
+    # Remove non-letters (plain ASCII words need no filtering);
+    # empty or non-word input ends up empty here
+    if not (word.isascii() and word.isalpha()):
+        word = ''.join(c for c in word if 'a' <= c <= 'z')
     if not word:
         return 0
     if len(word) <= 2:
@@ -84,10 +92,9 @@ def count_syllables(word: str) -> int:
     # Count vowel groups
     count = 0
     prev_vowel = False
-    vowels = 'aeiouy'
 
     for char in word:
-        is_vowel = char in vowels
+        is_vowel = char in VOWELS
         if is_vowel and not prev_vowel:
             count += 1
         prev_vowel = is_vowel
@@ -109,10 +116,9 @@ def count_syllables(word: str) -> int:
 def get_words(text: str) -> list[str]:
     """Split text into words."""
     # Replace punctuation with spaces, keep hyphens and apostrophes
-    text = re.sub(r"[^\w\s'-]", ' ', text)
-    words = text.split()
+    text = NON_WORD_PATTERN.sub(' ', text)
     # Filter to words with letters
-    return [w for w in words if w and re.search(r'[a-zA-Z]', w)]
+    return [w for w in text.split() if LETTER_PATTERN.search(w)]
 
 
 def detect_haiku(text: str) -> HaikuResult:
@@ -135,23 +141,22 @@ def detect_haiku(text: str) -> HaikuResult:
     if total_syllables != 17:
         return HaikuResult(detected=False)
 
-    # Try all possible splits to find 5-7-5
-    for i in range(1, len(words) - 1):
-        for j in range(i + 1, len(words)):
-            line1_syllables = sum(word_syllables[:i])
-            line2_syllables = sum(word_syllables[i:j])
-            line3_syllables = sum(word_syllables[j:])
-
-            if line1_syllables == 5 and line2_syllables == 7 and line3_syllables == 5:
-                return HaikuResult(
-                    detected=True,
-                    lines=[
-                        ' '.join(words[:i]),
-                        ' '.join(words[i:j]),
-                        ' '.join(words[j:]),
-                    ],
-                    syllables=[5, 7, 5],
-                )
+    # Find the 5-7-5 splits: prefix sums never decrease, so each line break
+    # is the first position where the running total hits 5 and then 12
+    prefix = list(accumulate(word_syllables, initial=0))
+    i = bisect_left(prefix, 5)
+    j = bisect_left(prefix, 12, lo=i)
+
+    if prefix[i] == 5 and prefix[j] == 12:
+        return HaikuResult(
+            detected=True,
+            lines=[
+                ' '.join(words[:i]),
+                ' '.join(words[i:j]),
+                ' '.join(words[j:]),
+            ],
+            syllables=[5, 7, 5],
+        )
 
     return HaikuResult(detected=False)
 
@@ -1,17 +1,22 @@
 """Tone classification using Gemini AI."""
 import os
+import re
 import json
+import asyncio
 import logging
+from collections import Counter
 from dataclasses import dataclass
 from typing import Optional, Literal
 
+import ahocorasick
+
 logger = logging.getLogger(__name__)
 
 ToneType = Literal['polite', 'neutral', 'frustrated', 'hostile', 'dramatic']
 ClassificationType = Literal['friendly', 'neutral', 'adversarial', 'hateful']
 
 
-@dataclass
+@dataclass(slots=True)
 class ToneResult:
     tone: ToneType
     confidence: float
@@ -43,15 +48,35 @@ POLITE_KEYWORDS = [
 ]
 
 
-def classify_tone_fallback(text: str) -> ToneResult:
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Compile all tone keywords into one automaton tagged by category."""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in (
+        ('hostile', HOSTILE_KEYWORDS),
+        ('frustrated', FRUSTRATED_KEYWORDS),
+        ('dramatic', DRAMATIC_KEYWORDS),
+        ('polite', POLITE_KEYWORDS),
+    ):
+        for kw in keywords:
+            automaton.add_word(kw, (category, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+TONE_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def classify_tone_fallback(text: str, lower_text: Optional[str] = None) -> ToneResult:
     """Keyword-based tone classification fallback."""
-    lower_text = text.lower()
+    if lower_text is None:
+        lower_text = text.lower()
 
-    # Count keyword matches
-    hostile_count = sum(1 for kw in HOSTILE_KEYWORDS if kw in lower_text)
-    frustrated_count = sum(1 for kw in FRUSTRATED_KEYWORDS if kw in lower_text)
-    dramatic_count = sum(1 for kw in DRAMATIC_KEYWORDS if kw in lower_text)
-    polite_count = sum(1 for kw in POLITE_KEYWORDS if kw in lower_text)
+    # Count distinct keyword matches per category in a single pass
+    counts = Counter(category for category, _ in {hit for _, hit in TONE_KEYWORD_AUTOMATON.iter(lower_text)})
+    hostile_count = counts['hostile']
+    frustrated_count = counts['frustrated']
+    dramatic_count = counts['dramatic']
+    polite_count = counts['polite']
 
     # Determine tone based on keyword counts
     if hostile_count >= 2:
@@ -86,35 +111,15 @@ def classify_tone_fallback(text: str) -> ToneResult:
         )
 
 
-async def classify_tone(text: str, api_key: Optional[str] = None) -> ToneResult:
-    """
-    Classify the tone of text using Gemini AI.
-    Falls back to keyword matching if API key not available.
-    """
-    if not api_key:
-        api_key = os.getenv('GOOGLE_API_KEY')
-
-    if not api_key:
-        return classify_tone_fallback(text)
-
-    try:
-        import google.generativeai as genai
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash')
-
-        prompt = f"""Analyze the tone of this text and classify it.
-
-Text: "{text[:500]}"
-
-Return ONLY valid JSON (no markdown):
-{{
+# Shared by the single and batch prompts
+TONE_SCHEMA = """{
   "tone": "polite" | "neutral" | "frustrated" | "hostile" | "dramatic",
   "confidence": 0.0-1.0,
   "classification": "friendly" | "neutral" | "adversarial" | "hateful",
   "trigger_phrase": "optional phrase that indicates the tone"
-}}
+}"""
 
-Definitions:
+TONE_DEFINITIONS = """Definitions:
 - polite: Kind, appreciative, welcoming
 - neutral: Matter-of-fact, no strong emotion
 - frustrated: Annoyed but not aggressive
@@ -126,27 +131,113 @@ Definitions:
 - adversarial: Critical, negative, attacking the community
 - hateful: Contains slurs, threats, or extreme hostility"""
 
-        response = model.generate_content(
+# Bound concurrent Gemini calls so a burst of analysis requests can't trip rate limits
+GEMINI_CONCURRENCY = int(os.getenv('GEMINI_CONCURRENCY', '4'))
+_gemini_semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+
+# Opening fence (optionally tagged json) up to the closing fence, or the end if unclosed
+MARKDOWN_FENCE_PATTERN = re.compile(r'```(?:json)?(.*?)(?:```|\Z)', re.DOTALL)
+
+
+def _clean_json_response(text_response: str) -> str:
+    """Strip markdown code fences Gemini sometimes wraps around JSON."""
+    text_response = text_response.strip()
+    match = MARKDOWN_FENCE_PATTERN.match(text_response)
+    return (match.group(1) if match else text_response).strip()
+
+
+def _to_tone_result(result: dict) -> ToneResult:
+    """Build a ToneResult from Gemini's JSON, filling in defaults."""
+    return ToneResult(
+        tone=result.get('tone', 'neutral'),
+        confidence=result.get('confidence', 0.7),
+        classification=result.get('classification', 'neutral'),
+        trigger_phrase=result.get('trigger_phrase'),
+    )
+
+
+async def _generate(api_key: str, prompt: str, max_output_tokens: int) -> str:
+    """Run a Gemini request off the event loop, bounded by the shared semaphore."""
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel('gemini-2.0-flash')
+
+    async with _gemini_semaphore:
+        # The SDK call is synchronous; run it in a worker thread
+        response = await asyncio.to_thread(
+            model.generate_content,
             prompt,
-            generation_config={'temperature': 0.1, 'max_output_tokens': 256},
+            generation_config={'temperature': 0.1, 'max_output_tokens': max_output_tokens},
         )
+    return response.text
 
-        text_response = response.text.strip()
-        # Clean markdown if present
-        if text_response.startswith('```'):
-            text_response = text_response.split('```')[1]
-            if text_response.startswith('json'):
-                text_response = text_response[4:]
-        text_response = text_response.strip()
 
-        result = json.loads(text_response)
-        return ToneResult(
-            tone=result.get('tone', 'neutral'),
-            confidence=result.get('confidence', 0.7),
-            classification=result.get('classification', 'neutral'),
-            trigger_phrase=result.get('trigger_phrase'),
-        )
+async def classify_tone(text: str, api_key: Optional[str] = None, lower_text: Optional[str] = None) -> ToneResult:
+    """
+    Classify the tone of text using Gemini AI.
+    Falls back to keyword matching if API key not available.
+    lower_text, if given, is reused by the fallback instead of recomputing text.lower().
+    """
+    if not api_key:
+        api_key = os.getenv('GOOGLE_API_KEY')
+
+    if not api_key:
+        return classify_tone_fallback(text, lower_text)
+
+    try:
+        prompt = f"""Analyze the tone of this text and classify it.
+
+Text: "{text[:500]}"
+
+Return ONLY valid JSON (no markdown):
+{TONE_SCHEMA}
+
+{TONE_DEFINITIONS}"""
+
+        text_response = await _generate(api_key, prompt, max_output_tokens=256)
+        return _to_tone_result(json.loads(_clean_json_response(text_response)))
 
     except Exception as e:
         logger.warning(f"Gemini tone classification failed: {e}, using fallback")
-        return classify_tone_fallback(text)
+        return classify_tone_fallback(text, lower_text)
+
+
+async def classify_tone_batch(texts: list[str], api_key: Optional[str] = None) -> list[ToneResult]:
+    """
+    Classify the tone of several texts with a single Gemini request.
+    Falls back to keyword matching if API key not available or the reply doesn't line up.
+    """
+    if not texts:
+        return []
+
+    if not api_key:
+        api_key = os.getenv('GOOGLE_API_KEY')
+
+    if not api_key:
+        return [classify_tone_fallback(text) for text in texts]
+
+    try:
+        numbered = "\n".join(f'{i + 1}. "{text[:500]}"' for i, text in enumerate(texts))
+        prompt = f"""Analyze the tone of each numbered text below and classify it.
+
+{numbered}
+
+Return ONLY a valid JSON array (no markdown) with one object per text, in the same order:
+[
+{TONE_SCHEMA}
+]
+
+{TONE_DEFINITIONS}"""
+
+        text_response = await _generate(api_key, prompt, max_output_tokens=min(256 * len(texts), 8192))
+        results = json.loads(_clean_json_response(text_response))
+
+        if not isinstance(results, list) or len(results) != len(texts):
+            raise ValueError(f"expected {len(texts)} results, got {len(results) if isinstance(results, list) else 'non-list'}")
+
+        return [_to_tone_result(result) for result in results]
+
+    except Exception as e:
+        logger.warning(f"Gemini batch tone classification failed: {e}, using fallback")
+        return [classify_tone_fallback(text) for text in texts]
@@ -9,20 +9,36 @@ Services:
 Integration Point: Use scraper_url in Devvit app settings
 """
 import os
+import random
 import hashlib
-import json
 import logging
 import re
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 import asyncio
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Query, HTTPException, Depends, Request
+from fastapi import FastAPI, Query, HTTPException, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import APIKeyHeader
-from cachetools import TTLCache
+from cachetools import LRUCache, TLRUCache, TTLCache
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree, html as lxml_html
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional - falls back to lxml
+    LexborHTMLParser = None
+
+try:
+    import ijson
+except ImportError:  # Optional - Ticketmaster responses are parsed whole instead
+    ijson = None
 
 from models import Event
 from deduplication import deduplicate_events
@@ -31,10 +47,30 @@ from deduplication import deduplicate_events
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shutdown hooks for the pooled clients the optional scraper modules keep, added as
+# each module is imported
+scraper_client_closers = []
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP client across requests so upstream connections are kept alive."""
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        headers=HTTP_HEADERS,
+    ) as client:
+        app.state.http_client = client
+        yield
+    for close in scraper_client_closers:
+        await close()
+
+
 app = FastAPI(
     title="Hub Bot 9000 - Event Scraper & Content Analyzer",
     version="1.0.0",
     docs_url="/docs" if os.getenv("ENABLE_DOCS", "false").lower() == "true" else None,
+    lifespan=lifespan,
 )
 
 # CORS - restrict to known origins in production
@@ -46,15 +82,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory cache with 1 hour TTL
-event_cache = TTLCache(maxsize=100, ttl=3600)
+EVENT_SERIALIZER = Event.__pydantic_serializer__
+
+# Event cache TTL (also used for Redis entries when REDIS_URL is set), jittered by
+# +/-10% per entry so keys cached together don't all expire and re-scrape together
+EVENT_CACHE_TTL = int(os.getenv("CACHE_TTL", "1800"))
+
+
+def jittered_cache_ttl() -> float:
+    return EVENT_CACHE_TTL * random.uniform(0.9, 1.1)
 
-# Simple rate limiting (in production, use Redis-backed rate limiter)
-request_counts: dict[str, list[float]] = {}
+
+event_cache = TLRUCache(maxsize=100, ttu=lambda key, value, now: now + jittered_cache_ttl())
+# Event scrapes in progress per cache key, and how long other instances wait on one
+inflight_event_scrapes: dict[str, asyncio.Future] = {}
+EVENT_SCRAPE_LOCK_MS = 60_000
+# Per-source deadlines (seconds) for one scrape; all stay under the lock above
+HTTP_SOURCE_TIMEOUT = 12
+WEB_SOURCE_TIMEOUT = 35  # each web scraper site gives up after 30s
+GEMINI_SOURCE_TIMEOUT = 45
+
+# Parsed Eventbrite events per page URL, so different days/refresh combos skip the HTML parse
+eventbrite_page_cache = TTLCache(maxsize=32, ttl=900)
+# Last ETag/Last-Modified and events per page URL, for conditional GETs after the above expires
+eventbrite_validators = LRUCache(maxsize=32)
+
+# Rate limiting: a Redis counter when configured (shared across instances),
+# otherwise a sliding window in memory with a bounded number of tracked clients
+request_counts = LRUCache(maxsize=10000)  # client IP -> request timestamps
 RATE_LIMIT = int(os.getenv("RATE_LIMIT", "30"))  # requests per minute
 RATE_WINDOW = 60  # seconds
+REDIS_URL = os.getenv("REDIS_URL")
 
-# HTTP headers for web requests
+# HTTP headers for web requests. Accept-Encoding is left to httpx: it advertises
+# gzip, deflate and (with the brotli package installed) br, and decodes each of them.
 HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Accept": "text/html,application/json,application/xhtml+xml",
@@ -75,9 +136,21 @@ if GOOGLE_API_KEY:
     except ImportError as e:
         logger.warning(f"Gemini scraper not available: {e}")
 
+# Gemini model for the /reddit/* fallback endpoints, configured once at startup
+gemini_flash_model = None
+if GOOGLE_API_KEY:
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=GOOGLE_API_KEY)
+        gemini_flash_model = genai.GenerativeModel("gemini-2.0-flash")
+    except ImportError as e:
+        logger.warning(f"Gemini Reddit search not available: {e}")
+
 # Initialize direct web scrapers (no AI needed)
 try:
     from scrapers.web_scrapers import fetch_all_seattle_events
+    from scrapers.web_scrapers import close_http_client as close_web_scraper_client
+    scraper_client_closers.append(close_web_scraper_client)
     web_scrapers_enabled = True
     logger.info("Direct web scrapers enabled")
 except ImportError as e:
@@ -104,6 +177,8 @@ ollama_available = False
 try:
     from scrapers.multi_source_scraper import fetch_all_events as fetch_multi_source_events
     from scrapers.multi_source_scraper import check_ollama_available, get_source_list
+    from scrapers.multi_source_scraper import close_http_client as close_multi_source_client
+    scraper_client_closers.append(close_multi_source_client)
     ollama_available = check_ollama_available()
     if ollama_available:
         multi_source_scraper = fetch_multi_source_events
@@ -111,26 +186,60 @@ try:
 except ImportError as e:
     pass  # Ollama is optional
 
+# Redis-backed rate limiting and event cache (optional)
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis.asyncio as redis
+        redis_client = redis.from_url(REDIS_URL)
+        logger.info("Redis rate limiting and event cache enabled")
+    except ImportError as e:
+        logger.warning(f"Redis not available: {e}")
+
 # Input validation patterns
-LOCATION_PATTERN = re.compile(r'^[a-zA-Z\s\-]{1,50}$')
-STATE_PATTERN = re.compile(r'^[A-Za-z]{2}$')
+# Matched with fullmatch(), so a trailing newline can't slip past a `$` anchor
+LOCATION_PATTERN = re.compile(r'[a-zA-Z\s\-]{1,50}')
+STATE_PATTERN = re.compile(r'[A-Za-z]{2}')
+SUBREDDIT_PATTERN = re.compile(r'[a-zA-Z0-9_]{3,21}')
+NON_ALPHA_PATTERN = re.compile(r'[^a-zA-Z]')
 
 
-def check_rate_limit(request: Request):
-    """Simple in-memory rate limiting."""
+async def check_rate_limit(request: Request):
+    """
+    Per-client rate limiting. With Redis this is a fixed-window counter shared across
+    instances (one INCR per request); otherwise a sliding window kept in memory.
+    """
     client_ip = request.client.host if request.client else "unknown"
-    now = datetime.now().timestamp()
 
-    if client_ip not in request_counts:
-        request_counts[client_ip] = []
+    if redis_client:
+        # Wall-clock window number, since the counter is shared with other instances
+        window = int(time.time()) // RATE_WINDOW
+        try:
+            key = f"ratelimit:{client_ip}:{window}"
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, RATE_WINDOW)
+                count, _ = await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limit check failed: {type(e).__name__}, using in-memory limiter")
+        else:
+            if count > RATE_LIMIT:
+                raise HTTPException(status_code=429, detail="Rate limit exceeded")
+            return
 
-    # Clean old entries
-    request_counts[client_ip] = [t for t in request_counts[client_ip] if now - t < RATE_WINDOW]
+    now = time.monotonic()
+    timestamps = request_counts.get(client_ip)
+    if timestamps is None:
+        timestamps = request_counts[client_ip] = deque()
 
-    if len(request_counts[client_ip]) >= RATE_LIMIT:
+    # Clean old entries; timestamps are in arrival order, so they expire from the left
+    while timestamps and now - timestamps[0] >= RATE_WINDOW:
+        timestamps.popleft()
+
+    if len(timestamps) >= RATE_LIMIT:
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
 
-    request_counts[client_ip].append(now)
+    timestamps.append(now)
 
 
 def verify_api_key(request: Request):
@@ -146,7 +255,7 @@ def verify_api_key(request: Request):
 def validate_location(location: str) -> str:
     """Validate and sanitize location input."""
     location = location.strip()
-    if not LOCATION_PATTERN.match(location):
+    if not LOCATION_PATTERN.fullmatch(location):
         raise HTTPException(status_code=400, detail="Invalid location format")
     return location
 
@@ -154,7 +263,7 @@ def validate_location(location: str) -> str:
 def validate_state(state: str) -> str:
     """Validate and sanitize state input."""
     state = state.strip().upper()
-    if not STATE_PATTERN.match(state):
+    if not STATE_PATTERN.fullmatch(state):
         raise HTTPException(status_code=400, detail="Invalid state format")
     return state
 
@@ -177,57 +286,168 @@ async def get_events(
     Returns deduplicated events for the next N days.
     """
     # Security checks
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
 
     # Validate inputs
     location = validate_location(location)
     state = validate_state(state)
 
+    client = request.app.state.http_client
+    event_json, cached = await get_upcoming_event_json(client, location, state, days, refresh=refresh)
+
+    if cached:
+        return events_response(event_json, cached=True)
+    return events_response(event_json, cached=False, total=len(event_json))
+
+
+async def get_upcoming_event_json(
+    client: httpx.AsyncClient, location: str, state: str, days: int, refresh: bool = False
+) -> tuple[list[bytes], bool]:
+    """
+    Serialized upcoming events for a location, shared by /events and /wiki-format.
+    Served from event_cache (then Redis, if configured) unless refresh is set; concurrent
+    misses for the same key share one scrape. Returns (events, cached).
+    """
     cache_key = f"{location}:{state}:{days}"
 
-    # Check cache unless refresh requested
-    if not refresh and cache_key in event_cache:
-        return {"events": event_cache[cache_key], "cached": True}
+    if not refresh:
+        event_json = cached_event_json(cache_key)
+        if event_json is None:
+            event_json = await shared_event_json(cache_key)
+        if event_json is not None:
+            return event_json, True
 
-    # Fetch from all sources concurrently
-    all_events = []
+    # Single-flight: later callers await the scrape already running for this key.
+    # shield() keeps one caller's disconnect from cancelling it for everyone else.
+    scrape = inflight_event_scrapes.get(cache_key)
+    if scrape is None:
+        scrape = asyncio.ensure_future(scrape_event_json(client, cache_key, location, state, days, refresh))
+        inflight_event_scrapes[cache_key] = scrape
+        scrape.add_done_callback(lambda _: inflight_event_scrapes.pop(cache_key, None))
+    return await asyncio.shield(scrape), False
+
+
+def cached_event_json(cache_key: str) -> Optional[list[bytes]]:
+    """Serialized events from this instance's event_cache, or None on a miss."""
+    return event_cache.get(cache_key)
+
+
+async def shared_event_json(cache_key: str) -> Optional[list[bytes]]:
+    """Serialized events cached in Redis by any instance, or None on a miss."""
+    if not redis_client:
+        return None
+    try:
+        value = await redis_client.get(f"events:{cache_key}")
+    except redis.RedisError as e:
+        logger.warning(f"Redis event cache read failed: {type(e).__name__}")
+        return None
+    if value is None:
+        return None
+    # orjson never emits a raw newline, so it safely separates events
+    return value.split(b"\n") if value else []
+
+
+async def scrape_event_json(
+    client: httpx.AsyncClient, cache_key: str, location: str, state: str, days: int, refresh: bool
+) -> list[bytes]:
+    """Scrape, dedupe and serialize events, then cache them locally and in Redis."""
+    lock_key = f"events:lock:{cache_key}"
+    locked = False
+    if redis_client:
+        try:
+            locked = await redis_client.set(lock_key, b"1", nx=True, px=EVENT_SCRAPE_LOCK_MS)
+            if not locked and not refresh:
+                # Another instance is already scraping this key; wait for its result
+                deadline = time.monotonic() + EVENT_SCRAPE_LOCK_MS / 1000
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.5)
+                    event_json = await shared_event_json(cache_key)
+                    if event_json is not None:
+                        return event_json
+                    if not await redis_client.exists(lock_key):
+                        break
+        except redis.RedisError as e:
+            logger.warning(f"Redis event cache lock failed: {type(e).__name__}")
+
+    try:
+        all_events = await fetch_all_events(client, location, state, days, refresh=refresh)
+
+        # Deduplicate, filter to requested date range and sort by date
+        events = upcoming_events(all_events, days)
+
+        # Cache serialized events so hits are a byte join, skipping FastAPI's encoder entirely.
+        # pydantic-core writes JSON straight from the model, without building a dict first.
+        # Each entry keeps its own list; event IDs are short hashes that repeat across
+        # locations and scrapes, so they can't key bytes shared between entries
+        event_json = [EVENT_SERIALIZER.to_json(event) for event in events]
+        event_cache[cache_key] = event_json
+
+        if redis_client:
+            try:
+                await redis_client.set(f"events:{cache_key}", b"\n".join(event_json), ex=int(jittered_cache_ttl()))
+            except redis.RedisError as e:
+                logger.warning(f"Redis event cache write failed: {type(e).__name__}")
+
+        return event_json
+    finally:
+        if locked:
+            try:
+                await redis_client.delete(lock_key)
+            except redis.RedisError:
+                pass  # Expires on its own
+
+
+async def fetch_source(name: str, coro, timeout: float) -> list[Event]:
+    """Await one source's fetch, giving up on it after `timeout` seconds."""
+    try:
+        async with asyncio.timeout(timeout):
+            events = await coro
+    except TimeoutError:
+        logger.warning(f"{name}: timed out after {timeout}s")
+        return []
+    logger.info(f"{name}: added {len(events)} events")
+    return events
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        tasks = []
 
-        # Eventbrite - JSON-LD extraction (no API key needed!)
-        tasks.append(fetch_eventbrite_jsonld(client, location, state, days))
+async def fetch_all_events(
+    client: httpx.AsyncClient, location: str, state: str, days: int, refresh: bool = False
+) -> list[Event]:
+    """Fetch events from every enabled source, before deduplication."""
+    # Fetch from all sources concurrently, each under its own deadline so one
+    # slow upstream only costs its own events
+    all_events = []
 
-        # Ticketmaster API (optional - needs API key)
-        if TICKETMASTER_API_KEY:
-            tasks.append(fetch_ticketmaster_events(client, location, state, days))
+    tasks = []
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Eventbrite - JSON-LD extraction (no API key needed!)
+    tasks.append(fetch_source(
+        "Eventbrite", fetch_eventbrite_jsonld(client, location, state, days, refresh=refresh), HTTP_SOURCE_TIMEOUT
+    ))
 
-        for result in results:
-            if isinstance(result, list):
-                all_events.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Scraper error: {type(result).__name__}")
+    # Ticketmaster API (optional - needs API key)
+    if TICKETMASTER_API_KEY:
+        tasks.append(fetch_source(
+            "Ticketmaster", fetch_ticketmaster_events(client, location, state, days), HTTP_SOURCE_TIMEOUT
+        ))
 
     # Gemini event scraper with search grounding (primary - fast)
     if gemini_event_scraper and location.lower() == "seattle":
-        try:
-            gemini_events = await gemini_event_scraper(location, days)
-            all_events.extend(gemini_events)
-            logger.info(f"Gemini events: added {len(gemini_events)} events")
-        except Exception as e:
-            logger.error(f"Gemini event scraper error: {type(e).__name__}: {e}")
-    
+        tasks.append(fetch_source("Gemini events", gemini_event_scraper(location, days), GEMINI_SOURCE_TIMEOUT))
+
     # Always run web scrapers for Seattle to maximize coverage
     if web_scrapers_enabled and location.lower() == "seattle":
-        try:
-            web_events = await fetch_all_seattle_events(days)
-            all_events.extend(web_events)
-            logger.info(f"Web scrapers: added {len(web_events)} events from EverOut/MoPOP/SeattleMet/Seattle.gov")
-        except Exception as e:
-            logger.error(f"Web scraper error: {type(e).__name__}: {e}")
+        tasks.append(fetch_source(
+            "Web scrapers (EverOut/MoPOP/SeattleMet/Seattle.gov)", fetch_all_seattle_events(days), WEB_SOURCE_TIMEOUT
+        ))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, list):
+            all_events.extend(result)
+        elif isinstance(result, Exception):
+            logger.error(f"Scraper error: {type(result).__name__}: {result}")
 
     # Ollama multi-source (for local dev without API key) - fallback only
     if not all_events and multi_source_scraper and location.lower() == "seattle":
@@ -247,74 +467,147 @@ async def get_events(
         except Exception as e:
             logger.error(f"Gemini scraper error: {type(e).__name__}")
 
-    # Deduplicate
-    deduplicated = deduplicate_events(all_events)
+    return all_events
+
 
-    # Filter to requested date range
+def events_response(event_json: list[bytes], **fields) -> Response:
+    """Build an {"events": [...], **fields} JSON response from pre-serialized events."""
+    # orjson.dumps(fields) is b'{...}'; drop its opening brace to append the fields
+    content = b'{"events":[' + b",".join(event_json) + b"]," + orjson.dumps(fields)[1:]
+    return Response(content=content, media_type="application/json")
+
+
+def upcoming_events(events: list[Event], days: int) -> list[Event]:
+    """Deduplicate events and return those in the next `days` days, sorted by date."""
     now = datetime.now()
-    end_date = now + timedelta(days=days)
+    start_str = now.strftime("%Y-%m-%d")
+    end_str = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+
     filtered = [
-        e for e in deduplicated
-        if e.dateStart and e.dateStart >= now.strftime("%Y-%m-%d") and e.dateStart <= end_date.strftime("%Y-%m-%d")
+        e for e in deduplicate_events(events)
+        if e.dateStart and start_str <= e.dateStart <= end_str
     ]
+    filtered.sort(key=attrgetter("dateStart"))
+    return filtered
 
-    # Sort by date
-    filtered.sort(key=lambda e: e.dateStart)
 
-    # Cache results
-    event_cache[cache_key] = [e.model_dump() for e in filtered]
+@lru_cache(maxsize=4096)
+def eventbrite_id_hash(url: str) -> str:
+    """Short stable hash of an event URL; listings repeat across reloads, so memoize."""
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
 
-    return {"events": event_cache[cache_key], "cached": False, "total": len(filtered)}
 
+# smart_strings=False returns plain str (orjson rejects lxml's str subclass)
+JSONLD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+# Without an explicit encoding lxml assumes Latin-1 for pages lacking a charset <meta>
+UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
 
-async def fetch_eventbrite_jsonld(client: httpx.AsyncClient, location: str, state: str, days: int) -> list[Event]:
+
+# Stop downloading an Eventbrite page once this many events are decoded
+EVENTBRITE_EVENT_LIMIT = 30
+
+# Pulls JSON-LD script bodies straight from the raw bytes, no DOM needed
+JSONLD_SCRIPT_PATTERN = re.compile(
+    rb'<script[^>]*\btype=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+# Just the opening tag, to find a JSON-LD block whose </script> hasn't arrived yet
+JSONLD_SCRIPT_OPEN_PATTERN = re.compile(rb'<script[^>]*\btype=["\']application/ld\+json["\'][^>]*>', re.IGNORECASE)
+
+
+def extract_jsonld_blocks(html: bytes) -> list[str | bytes]:
+    """Return the body of every <script type="application/ld+json"> block in a page."""
+    # A byte-level scan is several times faster than building a tree; only pages
+    # whose markup it doesn't recognize (e.g. an unquoted type) get a real parse
+    blocks = JSONLD_SCRIPT_PATTERN.findall(html)
+    if blocks:
+        return [block for block in blocks if block]
+
+    if LexborHTMLParser:
+        tree = LexborHTMLParser(html)
+        blocks = [node.text() for node in tree.css('script[type="application/ld+json"]')]
+    else:
+        try:
+            blocks = JSONLD_XPATH(lxml_html.fromstring(html, parser=UTF8_HTML_PARSER))
+        except etree.ParserError:  # empty document
+            return []
+    return [block for block in blocks if block]
+
+
+def eventbrite_jsonld_events(block: str | bytes, submitted_at: str) -> list[Event]:
+    """Convert one JSON-LD block to Events; only ItemList blocks carry listings."""
+    try:
+        data = orjson.loads(block)
+    except orjson.JSONDecodeError:
+        return []
+    if not isinstance(data, dict) or data.get('@type') != 'ItemList':
+        return []
+    return [
+        event for item in data.get('itemListElement', [])
+        if (event := eventbrite_event(item.get('item', {}), submitted_at))
+    ]
+
+
+async def fetch_eventbrite_jsonld(
+    client: httpx.AsyncClient, location: str, state: str, days: int, refresh: bool = False
+) -> list[Event]:
     """
     Fetch events from Eventbrite using JSON-LD extraction.
     No API key needed - extracts structured data from public pages.
+    Parsed pages are cached by URL; stale pages are revalidated with a conditional GET.
     """
     events = []
     try:
         # Eventbrite URL format: /d/state--city/events/
         # Sanitize inputs for URL construction
-        safe_state = re.sub(r'[^a-zA-Z]', '', state).lower()
-        safe_location = re.sub(r'[^a-zA-Z]', '', location).lower()
+        safe_state = NON_ALPHA_PATTERN.sub('', state).lower()
+        safe_location = NON_ALPHA_PATTERN.sub('', location).lower()
         url = f"https://www.eventbrite.com/d/{safe_state}--{safe_location}/events/"
+
+        if not refresh and url in eventbrite_page_cache:
+            return eventbrite_page_cache[url]
+
         logger.info(f"Fetching Eventbrite: {url}")
 
-        response = await client.get(url, headers=HTTP_HEADERS, follow_redirects=True)
-
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract JSON-LD structured data
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict) and data.get('@type') == 'ItemList':
-                        for item in data.get('itemListElement', []):
-                            event_data = item.get('item', {})
-                            if event_data.get('@type') == 'Event':
-                                # Extract date (format: 2025-12-27)
-                                date_start = event_data.get('startDate', '')[:10] if event_data.get('startDate') else ''
-
-                                # Get location
-                                location_data = event_data.get('location', {})
-                                location_name = location_data.get('name', '') if isinstance(location_data, dict) else ''
-
-                                event = Event(
-                                    id=f"eb_{hashlib.md5(event_data.get('url', '').encode()).hexdigest()[:8]}",
-                                    title=event_data.get('name', '')[:150],
-                                    description=None,  # JSON-LD doesn't include description
-                                    url=event_data.get('url', ''),
-                                    dateStart=date_start,
-                                    location=location_name[:100] if location_name else None,
-                                    submittedBy="Eventbrite",
-                                    submittedAt=datetime.now().isoformat(),
-                                )
-                                if event.title and event.dateStart:
-                                    events.append(event)
-                except json.JSONDecodeError:
-                    continue
+        validators, previous_events = eventbrite_validators.get(url, ({}, None))
+        async with client.stream("GET", url, headers=validators, follow_redirects=True) as response:
+            if response.status_code == 304 and previous_events is not None:
+                # Page unchanged since the last parse
+                events = previous_events
+            elif response.status_code == 200:
+                submitted_at = datetime.now().isoformat()
+
+                # Decode JSON-LD blocks as their </script> arrives and stop reading
+                # once we have enough events; the listing sits near the top of the page
+                page = bytearray()
+                scan_from = 0
+                resume = 0
+                async for chunk in response.aiter_bytes():
+                    page += chunk
+                    for match in JSONLD_SCRIPT_PATTERN.finditer(page, resume):
+                        events.extend(eventbrite_jsonld_events(match.group(1), submitted_at))
+                        scan_from = resume = match.end()
+                    if len(events) >= EVENTBRITE_EVENT_LIMIT:
+                        break
+                    # The next scan starts at a block still waiting for its </script>, or
+                    # else after the last complete tag, so each byte is only scanned once
+                    # (a tag cut off at the chunk boundary has no closing '>' yet)
+                    pending = JSONLD_SCRIPT_OPEN_PATTERN.search(page, resume)
+                    resume = pending.start() if pending else max(resume, page.rfind(b'>') + 1)
+
+                if not scan_from:
+                    # Markup the byte scan doesn't recognize; parse the whole page
+                    for block in extract_jsonld_blocks(bytes(page)):
+                        events.extend(eventbrite_jsonld_events(block, submitted_at))
+
+        if events:
+            eventbrite_page_cache[url] = events
+            validators = {}
+            if response.headers.get("etag"):
+                validators["If-None-Match"] = response.headers["etag"]
+            if response.headers.get("last-modified"):
+                validators["If-Modified-Since"] = response.headers["last-modified"]
+            if validators:
+                eventbrite_validators[url] = (validators, events)
 
         logger.info(f"Eventbrite: extracted {len(events)} events")
     except Exception as e:
@@ -336,7 +629,8 @@ async def fetch_ticketmaster_events(client: httpx.AsyncClient, location: str, st
 
         logger.info(f"Fetching Ticketmaster for {location}, {state}")
 
-        response = await client.get(
+        async with client.stream(
+            "GET",
             "https://app.ticketmaster.com/discovery/v2/events.json",
             params={
                 "apikey": TICKETMASTER_API_KEY,
@@ -347,39 +641,92 @@ async def fetch_ticketmaster_events(client: httpx.AsyncClient, location: str, st
                 "size": 30,
                 "sort": "date,asc",
             }
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            for event_data in data.get("_embedded", {}).get("events", []):
-                dates = event_data.get("dates", {}).get("start", {})
-
-                # Get venue info
-                venues = event_data.get("_embedded", {}).get("venues", [])
-                venue_name = venues[0].get("name", "") if venues else ""
-
-                event = Event(
-                    id=f"tm_{event_data['id']}",
-                    title=event_data.get("name", "")[:150],
-                    description=event_data.get("info", "")[:200] if event_data.get("info") else None,
-                    url=event_data.get("url", ""),
-                    dateStart=dates.get("localDate", ""),
-                    location=venue_name[:100] if venue_name else None,
-                    submittedBy="Ticketmaster",
-                    submittedAt=datetime.now().isoformat(),
-                )
-                if event.title and event.dateStart:
-                    events.append(event)
-
-            logger.info(f"Ticketmaster: extracted {len(events)} events")
-        else:
-            logger.warning(f"Ticketmaster API returned {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                submitted_at = datetime.now().isoformat()
+                if ijson:
+                    # Build events as they arrive instead of buffering the whole payload
+                    event_items = ijson.items_async(
+                        _AsyncByteReader(response.aiter_bytes()), "_embedded.events.item", use_float=True
+                    )
+                    async for event_data in event_items:
+                        event = ticketmaster_event(event_data, submitted_at)
+                        if event:
+                            events.append(event)
+                else:
+                    data = orjson.loads(await response.aread())
+                    for event_data in data.get("_embedded", {}).get("events", []):
+                        event = ticketmaster_event(event_data, submitted_at)
+                        if event:
+                            events.append(event)
+
+                logger.info(f"Ticketmaster: extracted {len(events)} events")
+            else:
+                logger.warning(f"Ticketmaster API returned {response.status_code}")
     except Exception as e:
         logger.error(f"Ticketmaster API error: {type(e).__name__}")
 
     return events
 
 
+def eventbrite_event(event_data: dict, submitted_at: str) -> Optional[Event]:
+    """Convert one JSON-LD ItemList entry to an Event, or None if it isn't a dated, titled event."""
+    # Check the required fields before paying for model validation
+    title = event_data.get('name')
+    date_start = event_data.get('startDate')
+    if event_data.get('@type') != 'Event' or not title or not date_start:
+        return None
+
+    # Get location
+    location_data = event_data.get('location')
+    location_name = location_data.get('name') if isinstance(location_data, dict) else None
+    url = event_data.get('url', '')
+
+    return Event(
+        id=f"eb_{eventbrite_id_hash(url)}",
+        title=title[:150],
+        description=None,  # JSON-LD doesn't include description
+        url=url,
+        dateStart=date_start[:10],  # format: 2025-12-27
+        location=location_name[:100] if location_name else None,
+        submittedBy="Eventbrite",
+        submittedAt=submitted_at,
+    )
+
+
+def ticketmaster_event(event_data: dict, submitted_at: str) -> Optional[Event]:
+    """Convert one Discovery API event object to an Event, or None if it lacks a title or date."""
+    dates = event_data.get("dates", {}).get("start", {})
+
+    # Get venue info
+    venues = event_data.get("_embedded", {}).get("venues", [])
+    venue_name = venues[0].get("name", "") if venues else ""
+
+    event = Event(
+        id=f"tm_{event_data['id']}",
+        title=event_data.get("name", "")[:150],
+        description=event_data.get("info", "")[:200] if event_data.get("info") else None,
+        url=event_data.get("url", ""),
+        dateStart=dates.get("localDate", ""),
+        location=venue_name[:100] if venue_name else None,
+        submittedBy="Ticketmaster",
+        submittedAt=submitted_at,
+    )
+    return event if event.title and event.dateStart else None
+
+
+class _AsyncByteReader:
+    """Adapts an async byte iterator to the async read() interface ijson expects."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes with read(0) to detect bytes vs str
+            return b""
+        return await anext(self._chunks, b"")
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint for Cloud Run."""
@@ -424,49 +771,37 @@ async def get_wiki_format(
     The wiki page can then be read by the Devvit app.
     """
     # Security checks
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
 
     # Validate inputs
     location = validate_location(location)
     state = validate_state(state)
 
-    # Get events using the standard endpoint logic
-    all_events = []
+    # Same events and cache entry as /events, so calling both doesn't scrape twice
+    client = request.app.state.http_client
+    event_json, _ = await get_upcoming_event_json(client, location, state, days)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        tasks = [fetch_eventbrite_jsonld(client, location, state, days)]
-        if TICKETMASTER_API_KEY:
-            tasks.append(fetch_ticketmaster_events(client, location, state, days))
+    # Format for wiki storage
+    return events_response(
+        event_json,
+        updated_at=datetime.now().isoformat(),
+        location=f"{location}, {state}",
+        days_ahead=days,
+        event_count=len(event_json),
+    )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for result in results:
-            if isinstance(result, list):
-                all_events.extend(result)
 
-    # Deduplicate
-    deduplicated = deduplicate_events(all_events)
 
-    # Filter to date range
-    now = datetime.now()
-    end_date = now + timedelta(days=days)
-    filtered = [
-        e for e in deduplicated
-        if e.dateStart and e.dateStart >= now.strftime("%Y-%m-%d") and e.dateStart <= end_date.strftime("%Y-%m-%d")
-    ]
-    filtered.sort(key=lambda e: e.dateStart)
+# Opening fence (optionally tagged json) up to the closing fence, or the end if unclosed
+MARKDOWN_FENCE_PATTERN = re.compile(r'```(?:json)?(.*?)(?:```|\Z)', re.DOTALL)
 
-    # Format for wiki storage
-    wiki_data = {
-        "updated_at": datetime.now().isoformat(),
-        "location": f"{location}, {state}",
-        "days_ahead": days,
-        "event_count": len(filtered),
-        "events": [e.model_dump() for e in filtered],
-    }
-
-    return wiki_data
 
+def strip_markdown_fence(text: str) -> str:
+    """Strip the markdown code fence Gemini sometimes wraps around JSON."""
+    text = text.strip()
+    match = MARKDOWN_FENCE_PATTERN.match(text)
+    return (match.group(1) if match else text).strip()
 
 
 # Reddit scraper using Gemini for when PullPush is unavailable
@@ -478,14 +813,10 @@ async def scrape_reddit_crosslinks_with_gemini(
     Use Gemini to find Reddit posts linking to a target subreddit.
     This is a fallback when PullPush.io is unavailable.
     """
-    if not GOOGLE_API_KEY:
+    if not gemini_flash_model:
         return []
     
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=GOOGLE_API_KEY)
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        
         prompt = f"""Search for recent Reddit posts from the last {days} days that link to or mention r/{target_subreddit}.
 
 Return ONLY a valid JSON array (no markdown) with this format:
@@ -503,21 +834,15 @@ Return ONLY a valid JSON array (no markdown) with this format:
 Only include posts that directly link to or discuss r/{target_subreddit}. 
 If no posts found, return: []"""
 
-        response = model.generate_content(
+        response = await asyncio.to_thread(
+            gemini_flash_model.generate_content,
             prompt,
             generation_config={"temperature": 0.1, "max_output_tokens": 4096},
         )
         
-        text = response.text.strip()
-        # Clean markdown code blocks
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+        text = strip_markdown_fence(response.text)
         
-        import json
-        return json.loads(text) if text else []
+        return orjson.loads(text) if text else []
     except Exception as e:
         logger.error(f"Gemini Reddit scrape failed: {type(e).__name__}: {e}")
         return []
@@ -533,12 +858,12 @@ async def get_reddit_crosslinks(
     Find Reddit posts that link to a target subreddit.
     Uses Gemini AI to search when PullPush is unavailable.
     """
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
     
     # Validate target subreddit name
     target = target.strip().replace("r/", "")
-    if not re.match(r'^[a-zA-Z0-9_]{3,21}$', target):
+    if not SUBREDDIT_PATTERN.fullmatch(target):
         raise HTTPException(status_code=400, detail="Invalid subreddit name")
     
     cache_key = f"crosslinks:{target}:{days}"
@@ -567,7 +892,7 @@ async def get_reddit_submissions(
     Search for Reddit submissions. Fallback endpoint for PullPush.
     Uses Gemini AI to search Reddit content.
     """
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
     
     if not any([subreddit, author, q]):
@@ -584,14 +909,10 @@ async def get_reddit_submissions(
     
     search_context = " ".join(search_parts)
     
-    if not GOOGLE_API_KEY:
+    if not gemini_flash_model:
         return {"data": [], "error": "Gemini API not configured"}
     
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=GOOGLE_API_KEY)
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        
         prompt = f"""Search for Reddit posts {search_context}.
 
 Return ONLY a valid JSON object (no markdown) with this format:
@@ -614,20 +935,15 @@ Return ONLY a valid JSON object (no markdown) with this format:
 
 Return up to {limit} results. If no posts found, return: {{"data": []}}"""
 
-        response = model.generate_content(
+        response = await asyncio.to_thread(
+            gemini_flash_model.generate_content,
             prompt,
             generation_config={"temperature": 0.1, "max_output_tokens": 8192},
         )
         
-        text = response.text.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+        text = strip_markdown_fence(response.text)
         
-        import json
-        result = json.loads(text) if text else {"data": []}
+        result = orjson.loads(text) if text else {"data": []}
         return result
     except Exception as e:
         logger.error(f"Gemini submission search failed: {type(e).__name__}: {e}")
@@ -641,19 +957,20 @@ Return up to {limit} results. If no posts found, return: {{"data": []}}"""
 # =============================================================================
 
 from models import ContentAnalysisRequest, ContentAnalysisResponse
-from detectors import detect_haiku, detect_farewell, detect_political_complaint, detect_crosslinks, classify_tone
-import time
+from detectors import detect_haiku, detect_farewell_and_political, detect_crosslinks, classify_tone
+
+ANALYZE_BATCH_CONCURRENCY = 10  # items from one /analyze/batch call analyzed at once
 
 
 def emit_detection_log(event_type: str, **kwargs):
     """Emit structured log for Cloud Logging metrics."""
     log_entry = {
         "event": event_type,
-        "timestamp": int(time.time() * 1000),
+        "timestamp": time.time_ns() // 1_000_000,
         **kwargs
     }
     # Structured JSON logging for GCP
-    print(json.dumps(log_entry))
+    print(orjson.dumps(log_entry).decode())
 
 
 @app.post("/analyze/content")
@@ -668,9 +985,14 @@ async def analyze_content(
     This is the main integration point - Devvit apps call this endpoint
     to get detection results for comments/posts.
     """
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
-    
+
+    return await run_content_analysis(content)
+
+
+async def run_content_analysis(content: ContentAnalysisRequest) -> ContentAnalysisResponse:
+    """Run every detector on one item. Callers handle rate limiting and auth."""
     start_time = time.time()
     events_emitted = []
     
@@ -678,20 +1000,18 @@ async def analyze_content(
     text = content.body
     if content.title:
         text = content.title + "\n\n" + content.body
-    # Haiku detection
-    haiku_result = detect_haiku(text)
-    
-    # Farewell detection
-    farewell_result = detect_farewell(text)
-    
-    # Political complaint detection
-    political_result = detect_political_complaint(text)
-    
-    # Crosslink detection
-    crosslink_result = detect_crosslinks(text, exclude_subreddit=content.subreddit)
-    
-    # Tone classification (async)
-    tone_result = await classify_tone(text)
+
+    # Lowercase once for the keyword/regex detectors that need it
+    lower_text = text.lower()
+
+    # CPU-bound detectors run in worker threads, overlapping the tone classification
+    # call and keeping the event loop free for other requests
+    haiku_result, (farewell_result, political_result), crosslink_result, tone_result = await asyncio.gather(
+        asyncio.to_thread(detect_haiku, text),
+        asyncio.to_thread(detect_farewell_and_political, text, lower_text),
+        asyncio.to_thread(detect_crosslinks, text, exclude_subreddit=content.subreddit),
+        classify_tone(text, lower_text=lower_text),
+    )
     
     # Emit structured logs for detections
     if haiku_result.detected:
@@ -791,22 +1111,27 @@ async def analyze_batch(
     Batch content analysis - analyze multiple items at once.
     More efficient than calling /analyze/content multiple times.
     """
-    check_rate_limit(request)
+    await check_rate_limit(request)
     verify_api_key(request)
     
     # Limit batch size
     if len(contents) > 50:
         raise HTTPException(status_code=400, detail="Batch size exceeds limit of 50")
     
-    results = []
-    for content in contents:
-        # Create a mock request for rate limiting bypass within batch
-        result = await analyze_content(request, content)
-        results.append(result)
+    # The batch counts as one request against the rate limit; items run concurrently
+    semaphore = asyncio.Semaphore(ANALYZE_BATCH_CONCURRENCY)
+
+    async def analyze_one(content: ContentAnalysisRequest) -> ContentAnalysisResponse:
+        async with semaphore:
+            return await run_content_analysis(content)
+
+    results = await asyncio.gather(*(analyze_one(content) for content in contents))
     
     return {"results": results, "count": len(results)}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8080)))
+    # loop/http "auto" pick uvloop and httptools when installed (uvicorn[standard]),
+    # falling back to asyncio and h11 elsewhere (e.g. Windows dev machines)
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8080)), loop="auto", http="auto")
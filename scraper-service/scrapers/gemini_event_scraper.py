@@ -4,16 +4,24 @@ Fast, reliable, uses free tier (15 req/min, 1500 req/day).
 """
 import os
 import re
-import json
+import asyncio
+import orjson
 import hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 import google.generativeai as genai
 
 from models import Event
+from deduplication import normalize_title
+from scrapers.llm_cache import llm_cache_key, get_cached_response, cache_response
+from scrapers.llm_response import EVENT_ARRAY_FORMAT, strip_markdown_fence
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
+MAX_CONCURRENT_SOURCES = 5  # Gemini requests in flight at once (free tier: 15 req/min)
+SOURCE_TIMEOUT = 60  # seconds per source
+
 # Seattle event sources - Gemini will search these via grounding
 EVENT_SOURCES = [
     {"name": "MoPOP", "query": "site:mopop.org upcoming events Seattle", "icon": "museum"},
@@ -29,8 +37,9 @@ EVENT_SOURCES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_gemini_model():
-    """Initialize Gemini model with search grounding."""
+    """Initialize Gemini model with search grounding (built once, then reused across calls)."""
     if not GOOGLE_API_KEY:
         return None
 
@@ -45,56 +54,67 @@ def get_gemini_model():
     )
 
 
+GROUNDING_TOOLS = [{"google_search_retrieval": {"dynamic_retrieval_config": {"mode": "MODE_DYNAMIC"}}}]
+
+
+async def generate_grounded(model, prompt: str) -> tuple[str, Optional[str]]:
+    """
+    Run a Search-grounded prompt in a worker thread and return (text, cache_key);
+    repeated prompts are served from the LLM cache. cache_key is set only for a fresh
+    reply, which the caller stores with cache_response once it has parsed.
+    """
+    cache_key = llm_cache_key(model.model_name, prompt, tools="google_search_retrieval")
+    text = await get_cached_response(cache_key)
+    if text is not None:
+        return text, None
+    response = await asyncio.to_thread(model.generate_content, prompt, tools=GROUNDING_TOOLS)
+    return response.text.strip(), cache_key
+
+
+ISO_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def is_iso_date(value) -> bool:
+    """True for strings starting with a YYYY-MM-DD date, the only form /events can filter on."""
+    return isinstance(value, str) and ISO_DATE_PATTERN.match(value) is not None
+
+
 def generate_event_id(title: str, date: str, source: str) -> str:
     """Generate consistent event ID."""
     key = f"{title}:{date}:{source}"
-    return f"evt_{hashlib.md5(key.encode()).hexdigest()[:12]}"
+    return f"evt_{hashlib.blake2b(key.encode(), digest_size=6).hexdigest()}"
 
 
 async def fetch_events_from_source(model, source: dict, location: str, days: int) -> list[Event]:
     """Fetch events from a single source using Gemini with search grounding."""
     events = []
-    today = datetime.now().strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+    submitted_at = now.isoformat()
 
     prompt = f"""Search for upcoming events in {location} from {source['name']}.
 
 Find events happening between {today} and {end_date}.
 
 Return ONLY a JSON array (no markdown, no explanation):
-[
-  {{
-    "title": "Event Name",
-    "date": "YYYY-MM-DD",
-    "location": "Venue Name",
-    "url": "https://...",
-    "description": "Brief description"
-  }}
-]
+{EVENT_ARRAY_FORMAT}
 
 If no events found, return: []
 
 Search: {source['query']} {location} {today}"""
 
     try:
-        response = model.generate_content(
-            prompt,
-            tools=[{"google_search_retrieval": {"dynamic_retrieval_config": {"mode": "MODE_DYNAMIC"}}}]
-        )
-
-        text = response.text.strip()
-
-        # Clean markdown
-        if text.startswith("```"):
-            text = re.sub(r'^```json?\n?', '', text)
-            text = re.sub(r'\n?```$', '', text)
-        text = text.strip()
+        text, cache_key = await generate_grounded(model, prompt)
+        text = strip_markdown_fence(text)
 
         if text and text.startswith("["):
-            events_data = json.loads(text)
+            events_data = orjson.loads(text)
+            if cache_key:
+                await cache_response(cache_key, text)
 
             for evt in events_data:
-                if evt.get("title") and evt.get("date"):
+                if evt.get("title") and is_iso_date(evt.get("date")):
                     event = Event(
                         id=generate_event_id(evt["title"], evt["date"], source["name"]),
                         title=evt["title"][:150],
@@ -103,7 +123,7 @@ Search: {source['query']} {location} {today}"""
                         dateStart=evt["date"],
                         location=evt.get("location", "Seattle, WA")[:100] if evt.get("location") else "Seattle, WA",
                         submittedBy=source["name"],
-                        submittedAt=datetime.now().isoformat(),
+                        submittedAt=submitted_at,
                     )
                     events.append(event)
 
@@ -111,7 +131,7 @@ Search: {source['query']} {location} {today}"""
         else:
             print(f"Gemini [{source['name']}]: no events found")
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Gemini [{source['name']}]: JSON error - {e}")
     except Exception as e:
         error_msg = str(e)
@@ -153,15 +173,28 @@ async def fetch_all_seattle_events(
 
     print(f"Fetching events from {len(active_sources)} sources via Gemini...")
 
-    for source in active_sources:
-        events = await fetch_events_from_source(model, source, location, days)
-        all_events.extend(events)
+    # Query sources concurrently, bounded to stay under the per-minute quota; a source
+    # that hangs is dropped after SOURCE_TIMEOUT instead of stalling the rest
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+
+    async def fetch_guarded(source: dict) -> list[Event]:
+        async with semaphore:
+            async with asyncio.timeout(SOURCE_TIMEOUT):
+                return await fetch_events_from_source(model, source, location, days)
 
-    # Deduplicate
+    results = await asyncio.gather(*(fetch_guarded(s) for s in active_sources), return_exceptions=True)
+    for source, result in zip(active_sources, results):
+        if isinstance(result, list):
+            all_events.extend(result)
+        else:
+            print(f"Gemini [{source['name']}]: {type(result).__name__}")
+
+    # Deduplicate on the full normalized title; a fixed-length prefix merged distinct
+    # events that share a long lead-in and missed whitespace/"FREE:"-style variants
     seen_titles = set()
     unique_events = []
     for event in all_events:
-        title_key = event.title.lower()[:30]
+        title_key = normalize_title(event.title)
         if title_key not in seen_titles:
             seen_titles.add(title_key)
             unique_events.append(event)
@@ -179,8 +212,10 @@ async def fetch_events_single_query(location: str = "Seattle", days: int = 14) -
     if not model:
         return []
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+    submitted_at = now.isoformat()
 
     prompt = f"""Find upcoming events in {location}, Washington happening between {today} and {end_date}.
 
@@ -203,22 +238,17 @@ Include concerts, exhibitions, festivals, community events, museum programs.
 Return [] if no events found."""
 
     try:
-        response = model.generate_content(
-            prompt,
-            tools=[{"google_search_retrieval": {"dynamic_retrieval_config": {"mode": "MODE_DYNAMIC"}}}]
-        )
-
-        text = response.text.strip()
-        if text.startswith("```"):
-            text = re.sub(r'^```json?\n?', '', text)
-            text = re.sub(r'\n?```$', '', text)
+        text, cache_key = await generate_grounded(model, prompt)
+        text = strip_markdown_fence(text)
 
         events = []
         if text and text.startswith("["):
-            events_data = json.loads(text)
+            events_data = orjson.loads(text)
+            if cache_key:
+                await cache_response(cache_key, text)
 
             for evt in events_data:
-                if evt.get("title"):
+                if evt.get("title") and is_iso_date(evt.get("date")):
                     event = Event(
                         id=generate_event_id(evt["title"], evt.get("date", ""), evt.get("source", "Gemini")),
                         title=evt["title"][:150],
@@ -227,7 +257,7 @@ Return [] if no events found."""
                         dateStart=evt.get("date"),
                         location=evt.get("location", "Seattle, WA")[:100],
                         submittedBy=evt.get("source", "Gemini Search"),
-                        submittedAt=datetime.now().isoformat(),
+                        submittedAt=submitted_at,
                     )
                     events.append(event)
 
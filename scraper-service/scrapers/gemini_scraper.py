@@ -3,16 +3,24 @@ Gemini-based event scraper using Google Search grounding.
 Handles sites that block traditional scrapers.
 """
 import os
-import json
+import asyncio
+import hashlib
+import orjson
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 import google.generativeai as genai
 
 from models import Event
+from scrapers.gemini_event_scraper import generate_grounded
+from scrapers.llm_cache import cache_response
+from scrapers.llm_response import EVENT_ARRAY_FORMAT, strip_markdown_fence
 
 # Configure Gemini
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
+MAX_CONCURRENT_SOURCES = 3  # Gemini requests in flight at once (free tier: 15 req/min)
+
 # Event sources to scrape via Gemini
 # Tested December 2025 - ranked by reliability
 GEMINI_SOURCES = [
@@ -57,8 +65,9 @@ GEMINI_SOURCES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_gemini_model():
-    """Initialize Gemini model with grounding."""
+    """Initialize Gemini model with grounding (built once, then reused across calls)."""
     if not GOOGLE_API_KEY:
         return None
 
@@ -76,6 +85,11 @@ def get_gemini_model():
     return model
 
 
+def event_id_hash(title: str, date: str) -> str:
+    """Stable 8-hex-digit hash for event IDs (hash() is salted per process, so IDs changed on restart)."""
+    return hashlib.blake2b(f"{title}|{date}".encode(), digest_size=4).hexdigest()
+
+
 async def fetch_events_with_gemini(location: str = "Seattle", days: int = 7) -> list[Event]:
     """
     Use Gemini with Google Search grounding to find events.
@@ -86,71 +100,65 @@ async def fetch_events_with_gemini(location: str = "Seattle", days: int = 7) ->
         return []
 
     all_events = []
-    today = datetime.now().strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+    submitted_at = now.isoformat()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
 
-    for source in GEMINI_SOURCES:
+    async def fetch_source(source: dict) -> list[Event]:
+        events = []
         try:
             prompt = f"""Search for upcoming events in {location} from {source['name']}.
 
 Find events happening between {today} and {end_date}.
 
 Return ONLY a JSON array of events with this exact format (no markdown, no explanation):
-[
-  {{
-    "title": "Event Name",
-    "date": "YYYY-MM-DD",
-    "location": "Venue Name",
-    "url": "https://...",
-    "description": "Brief description"
-  }}
-]
+{EVENT_ARRAY_FORMAT}
 
 If no events found, return an empty array: []
 
 Search query: {source['query']} {location} {today}"""
 
             # Use Google Search grounding
-            response = model.generate_content(
-                prompt,
-                tools=[{"google_search_retrieval": {"dynamic_retrieval_config": {"mode": "MODE_DYNAMIC"}}}]
-            )
-
-            # Parse the response
-            text = response.text.strip()
+            async with semaphore:
+                text, cache_key = await generate_grounded(model, prompt)
 
             # Clean up response - remove markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
+            text = strip_markdown_fence(text)
 
             if text and text.startswith("["):
-                events_data = json.loads(text)
+                events_data = orjson.loads(text)
+                if cache_key:
+                    await cache_response(cache_key, text)
 
                 for evt in events_data:
                     if evt.get("title") and evt.get("date"):
                         event = Event(
-                            id=f"gem_{hash(evt['title'] + evt['date']) & 0xFFFFFFFF:08x}",
+                            id=f"gem_{event_id_hash(evt['title'], evt['date'])}",
                             title=evt["title"][:150],
                             description=evt.get("description", "")[:200] if evt.get("description") else None,
                             url=evt.get("url", ""),
                             dateStart=evt["date"],
                             location=evt.get("location", "")[:100] if evt.get("location") else None,
                             submittedBy=source["name"],
-                            submittedAt=datetime.now().isoformat(),
+                            submittedAt=submitted_at,
                         )
-                        all_events.append(event)
+                        events.append(event)
 
                 print(f"Gemini: {source['name']} returned {len(events_data)} events")
             else:
                 print(f"Gemini: {source['name']} returned no parseable events")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Gemini: JSON parse error for {source['name']}: {e}")
         except Exception as e:
             print(f"Gemini: Error fetching {source['name']}: {e}")
+        return events
+
+    # Sources are independent; query them concurrently, results kept in source order
+    for events in await asyncio.gather(*(fetch_source(s) for s in GEMINI_SOURCES)):
+        all_events.extend(events)
 
     return all_events
 
@@ -168,8 +176,10 @@ async def fetch_specific_source_with_gemini(
     if not model:
         return []
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    end_date = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    end_date = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+    submitted_at = now.isoformat()
 
     try:
         prompt = f"""Look up events from this source: {source_url}
@@ -177,44 +187,29 @@ async def fetch_specific_source_with_gemini(
 Find events in {location} happening between {today} and {end_date}.
 
 Return ONLY a JSON array (no markdown, no explanation):
-[
-  {{
-    "title": "Event Name",
-    "date": "YYYY-MM-DD",
-    "location": "Venue Name",
-    "url": "https://...",
-    "description": "Brief description"
-  }}
-]
+{EVENT_ARRAY_FORMAT}
 
 If no events found, return: []"""
 
-        response = model.generate_content(
-            prompt,
-            tools=[{"google_search_retrieval": {"dynamic_retrieval_config": {"mode": "MODE_DYNAMIC"}}}]
-        )
-
-        text = response.text.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+        text, cache_key = await generate_grounded(model, prompt)
+        text = strip_markdown_fence(text)
 
         events = []
         if text and text.startswith("["):
-            events_data = json.loads(text)
+            events_data = orjson.loads(text)
+            if cache_key:
+                await cache_response(cache_key, text)
             for evt in events_data:
                 if evt.get("title") and evt.get("date"):
                     event = Event(
-                        id=f"gem_{hash(evt['title'] + evt['date']) & 0xFFFFFFFF:08x}",
+                        id=f"gem_{event_id_hash(evt['title'], evt['date'])}",
                         title=evt["title"][:150],
                         description=evt.get("description", "")[:200] if evt.get("description") else None,
                         url=evt.get("url", source_url),
                         dateStart=evt["date"],
                         location=evt.get("location", "")[:100] if evt.get("location") else None,
                         submittedBy=source_name,
-                        submittedAt=datetime.now().isoformat(),
+                        submittedAt=submitted_at,
                     )
                     events.append(event)
 
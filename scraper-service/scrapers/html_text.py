@@ -0,0 +1,36 @@
+"""Page text extraction for the LLM scrapers: HTML tags cost tokens but carry no events."""
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+def node_text(node) -> str:
+    """Whitespace-normalized text of a parsed node (selectolax or BeautifulSoup)."""
+    if LexborHTMLParser:
+        return ' '.join(node.text(separator=' ').split())
+    return node.get_text(separator=' ', strip=True)
+
+
+def page_text(html: str, selector: Optional[str]) -> str:
+    """Text to extract events from: the selector's matches, else the main content or body."""
+    # Lexbor builds the tree in C, several times faster than BeautifulSoup; its
+    # fallback uses lxml rather than the pure-Python html.parser
+    if LexborHTMLParser:
+        tree = LexborHTMLParser(html)
+        select, select_one = tree.css, tree.css_first
+    else:
+        tree = BeautifulSoup(html, 'lxml')
+        select, select_one = tree.select, tree.select_one
+
+    # Extract text using selector or full body
+    if selector:
+        return ' '.join([node_text(e) for e in select(selector)[:15]])
+    main = select_one('main, article, .content, #content')
+    if main:
+        return node_text(main)
+    return node_text(tree.body)[:15000] if tree.body else ""
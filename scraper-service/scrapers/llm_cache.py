@@ -0,0 +1,58 @@
+"""
+Exact-match cache for LLM responses.
+Scrapes re-send identical prompts for pages that haven't changed, so the raw response
+is cached by a hash of model + options + prompt. Entries live in memory, and in Redis
+too when REDIS_URL is set, so instances share them. Prompts that embed today's date
+stop matching at day rollover.
+"""
+import os
+import hashlib
+from typing import Optional
+
+import orjson
+from cachetools import TTLCache
+
+REDIS_URL = os.getenv("REDIS_URL")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))  # seconds
+
+local_cache = TTLCache(maxsize=256, ttl=LLM_CACHE_TTL)
+
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis.asyncio as redis
+        redis_client = redis.from_url(REDIS_URL)
+    except ImportError:
+        pass  # Memory-only cache
+
+
+def llm_cache_key(model: str, prompt: str, **options) -> str:
+    """Cache key for one model call; options are anything that changes the output."""
+    payload = orjson.dumps(options, option=orjson.OPT_SORT_KEYS) + b"|" + prompt.encode()
+    return f"llm:{model}:{hashlib.sha256(payload).hexdigest()}"
+
+
+async def get_cached_response(key: str) -> Optional[str]:
+    """Cached response text for a key, or None on a miss."""
+    response = local_cache.get(key)
+    if response is not None or not redis_client:
+        return response
+    try:
+        value = await redis_client.get(key)
+    except redis.RedisError as e:
+        print(f"LLM cache read failed: {type(e).__name__}")
+        return None
+    if value is None:
+        return None
+    response = local_cache[key] = value.decode()
+    return response
+
+
+async def cache_response(key: str, response: str):
+    """Store a response; callers skip ones they couldn't use, so those get retried."""
+    local_cache[key] = response
+    if redis_client:
+        try:
+            await redis_client.set(key, response, ex=LLM_CACHE_TTL)
+        except redis.RedisError as e:
+            print(f"LLM cache write failed: {type(e).__name__}")
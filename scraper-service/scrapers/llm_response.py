@@ -0,0 +1,117 @@
+"""Helpers for reading and cleaning up raw LLM text before JSON parsing."""
+import os
+import re
+from typing import Optional, Union
+
+import httpx
+import orjson
+
+# Whole leading ```/```json fence; the closing fence may be cut off by the token limit
+MARKDOWN_FENCE_PATTERN = re.compile(r'```(?:json)?(.*?)(?:```|\Z)', re.DOTALL)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# How long Ollama keeps the model loaded after a request; scrapes come in bursts of
+# calls, and reloading the weights between them costs seconds each time
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# Output schema shared by the event extraction prompts; built once, not per prompt
+EVENT_ARRAY_FORMAT = """[
+  {
+    "title": "Event Name",
+    "date": "YYYY-MM-DD",
+    "location": "Venue Name",
+    "url": "https://...",
+    "description": "Brief description"
+  }
+]"""
+
+# JSON schemas for Ollama structured output, so decoding can only produce the JSON
+# the prompts ask for
+EVENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "date": {"type": "string"},
+        "location": {"type": "string"},
+        "url": {"type": "string"},
+        "description": {"type": "string"},
+    },
+    "required": ["title", "date"],
+}
+EVENT_ARRAY_SCHEMA = {"type": "array", "items": EVENT_SCHEMA}
+
+
+def strip_markdown_fence(text: str) -> str:
+    """Strip the markdown code fence models sometimes wrap around JSON."""
+    text = text.strip()
+    match = MARKDOWN_FENCE_PATTERN.match(text)
+    return (match.group(1) if match else text).strip()
+
+
+class JsonValueScanner:
+    """Follows streamed text until the first top-level JSON array or object closes."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> int:
+        """Consume the next piece of text; returns the offset just past the value's end, or -1."""
+        for i, char in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                # Only strings inside the value matter; quotes in leading prose don't
+                self.in_string = self.depth > 0
+            elif char in '[{':
+                self.depth += 1
+            elif char in ']}' and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return i + 1
+        return -1
+
+
+async def stream_ollama_generate(
+    client: httpx.AsyncClient, url: str, model: str, prompt: str, options: dict,
+    format: Optional[Union[str, dict]] = None, timeout=httpx.USE_CLIENT_DEFAULT,
+) -> str:
+    """
+    Run an Ollama /api/generate call with streaming and return the response text.
+    `format` is "json" or a JSON schema to constrain the output to. Reading stops as
+    soon as the reply's JSON value is closed; dropping the stream there also stops
+    Ollama generating any trailing explanation.
+    """
+    payload = {"model": model, "prompt": prompt, "stream": True, "options": options, "keep_alive": OLLAMA_KEEP_ALIVE}
+    if format:
+        payload["format"] = format
+    pieces = []
+    scanner = JsonValueScanner()
+    async with client.stream(
+        "POST",
+        f"{url}/api/generate",
+        content=orjson.dumps(payload),
+        headers=JSON_HEADERS,
+        timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            frame = orjson.loads(line)
+            piece = frame.get("response", "")
+            end = scanner.feed(piece)
+            if end >= 0:
+                pieces.append(piece[:end])
+                break
+            pieces.append(piece)
+            if frame.get("done"):
+                break
+    return "".join(pieces)
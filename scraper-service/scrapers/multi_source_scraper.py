@@ -3,20 +3,44 @@ Multi-source Seattle event scraper using Ollama LLM extraction.
 Tested December 2025 - all sources verified working.
 """
 import os
-import re
-import json
+import orjson
+import asyncio
 import hashlib
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
+import httpx
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from cachetools import LRUCache, TTLCache
 
 from models import Event
+from scrapers.llm_cache import LLM_CACHE_TTL, llm_cache_key, get_cached_response, cache_response
+from scrapers.html_text import page_text
+from scrapers.llm_response import EVENT_ARRAY_SCHEMA, JSON_HEADERS, strip_markdown_fence, stream_ollama_generate
 
 # Ollama configuration
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma3")
 
+# Source texts that arrive within OLLAMA_BATCH_WAIT_MS of each other are extracted
+# in one Ollama request (up to OLLAMA_MAX_BATCH documents), so the request and
+# prompt-eval overhead is paid once per batch instead of once per source
+OLLAMA_MAX_BATCH = 8
+OLLAMA_BATCH_WAIT_MS = 100
+
+# Semantic cache: a source whose page text embeds within SEMANTIC_CACHE_THRESHOLD
+# (cosine) of its last extracted text reuses that extraction instead of re-running
+# the LLM - catches pages that differ only in counters, timestamps, ads, etc.
+OLLAMA_EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
+SEMANTIC_CACHE_THRESHOLD = 0.97
+# Source name -> (unit-length embedding of its last extracted text, extracted events)
+semantic_cache = TTLCache(maxsize=64, ttl=LLM_CACHE_TTL)
+# Source URL -> (conditional GET headers, body hash, extracted events) from the last
+# scrape that found events; a 304 or identical body skips parsing and Ollama entirely
+source_page_cache = LRUCache(maxsize=64)
+
 # Verified working Seattle event sources - December 2025
 EVENT_SOURCES = [
     # Museums - excellent event data
@@ -98,13 +122,34 @@ EVENT_SOURCES = [
 ]
 
 
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Client reused across scrapes, so source and Ollama connections stay open between
+    runs. httpx negotiates gzip/brotli by default; failed connects are retried twice.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": "Mozilla/5.0 (compatible; hub-bot-9000/1.0)"},
+        transport=httpx.AsyncHTTPTransport(
+            retries=2, limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        ),
+    )
+
+
+async def close_http_client():
+    """Close the shared client if one was created; the app calls this on shutdown."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+
+
 def generate_event_id(title: str, date: str, source: str) -> str:
     """Generate a consistent event ID."""
     key = f"{title}:{date}:{source}"
-    return f"evt_{hashlib.md5(key.encode()).hexdigest()[:12]}"
+    return f"evt_{hashlib.blake2b(key.encode(), digest_size=6).hexdigest()}"
 
 
-def extract_with_ollama(text: str, source_name: str, timeout: int = 120) -> list[dict]:
+async def extract_with_ollama(client: httpx.AsyncClient, text: str, source_name: str, timeout: int = 120) -> list[dict]:
     """Extract events from text using Ollama LLM."""
     if not text or len(text) < 50:
         return []
@@ -120,34 +165,33 @@ Use actual dates from the text. Return [] if no events found.
 
 JSON:"""
 
+    # 8k context fits the ~3k-token text plus the reply (Ollama's default is smaller)
+    options = {"temperature": 0.1, "num_predict": 3000, "num_ctx": 8192}
+    cache_key = llm_cache_key(OLLAMA_MODEL, prompt, format=EVENT_ARRAY_SCHEMA, **options)
+
     try:
-        resp = requests.post(
-            f"{OLLAMA_URL}/api/generate",
-            json={
-                "model": OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"temperature": 0.1, "num_predict": 3000}
-            },
-            timeout=timeout
+        resp_text = await get_cached_response(cache_key)
+        if resp_text is not None:
+            events = orjson.loads(resp_text)
+            print(f"  Ollama: {len(events)} events (cached)")
+            return events
+
+        started = time.monotonic()
+        resp_text = strip_markdown_fence(
+            await stream_ollama_generate(
+                client, OLLAMA_URL, OLLAMA_MODEL, prompt, options, format=EVENT_ARRAY_SCHEMA, timeout=timeout
+            )
         )
-        result = resp.json()
-        resp_text = result.get("response", "").strip()
-
-        # Clean markdown code blocks
-        if resp_text.startswith("```"):
-            resp_text = re.sub(r'^```json?\n?', '', resp_text)
-            resp_text = re.sub(r'\n?```$', '', resp_text)
 
-        events = json.loads(resp_text)
-        duration = result.get("total_duration", 0) / 1e9
-        print(f"  Ollama: {len(events)} events in {duration:.1f}s")
+        events = orjson.loads(resp_text)
+        await cache_response(cache_key, resp_text)
+        print(f"  Ollama: {len(events)} events in {time.monotonic() - started:.1f}s")
         return events
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"  Ollama JSON error: {e}")
         return []
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print(f"  Ollama timeout")
         return []
     except Exception as e:
@@ -155,7 +199,204 @@ JSON:"""
         return []
 
 
-async def fetch_source_events(source: dict) -> list[Event]:
+async def embed_text(client: httpx.AsyncClient, text: str) -> Optional[np.ndarray]:
+    """Unit-length embedding of a page text, or None if the embedding model isn't available."""
+    try:
+        resp = await client.post(
+            f"{OLLAMA_URL}/api/embeddings",
+            content=orjson.dumps({"model": OLLAMA_EMBED_MODEL, "prompt": text[:10000]}),
+            headers=JSON_HEADERS,
+            timeout=30
+        )
+        if resp.status_code != 200:
+            return None
+        vector = np.asarray(orjson.loads(resp.content).get("embedding") or (), dtype=np.float32)
+    except Exception as e:
+        print(f"  Ollama embedding error: {type(e).__name__}")
+        return None
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else None
+
+
+async def extract_batch_with_ollama(
+    client: httpx.AsyncClient, documents: list[tuple[str, str]], timeout: int = 300
+) -> Optional[list[list[dict]]]:
+    """
+    Extract events from several (source_name, text) documents in one Ollama request.
+    Returns one event list per document, or None if the reply doesn't have that shape.
+    """
+    sections = "\n\n".join(
+        f"Document {i} ({source_name}):\n{text[:10000]}"
+        for i, (source_name, text) in enumerate(documents, 1)
+    )
+    prompt = f"""Extract ALL events from each of these {len(documents)} website texts.
+Return ONLY a valid JSON array with exactly {len(documents)} elements - no markdown, no explanation.
+Element i is the array of events from Document i ([] if it has none).
+
+{sections}
+
+Event format: {{"title":"Event Name","date":"YYYY-MM-DD","location":"Venue","description":"Brief"}}
+Use actual dates from the text.
+
+JSON:"""
+
+    options = {
+        "temperature": 0.1,
+        "num_predict": 3000 * len(documents),
+        # Room for every document (~3 chars/token) plus the reply
+        "num_ctx": len(prompt) // 3 + 3000 * len(documents),
+    }
+    # One event array per document
+    format = {"type": "array", "items": EVENT_ARRAY_SCHEMA, "minItems": len(documents), "maxItems": len(documents)}
+    cache_key = llm_cache_key(OLLAMA_MODEL, prompt, format=format, **options)
+
+    try:
+        resp_text = await get_cached_response(cache_key)
+        cached = resp_text is not None
+        if not cached:
+            started = time.monotonic()
+            resp_text = strip_markdown_fence(
+                await stream_ollama_generate(
+                    client, OLLAMA_URL, OLLAMA_MODEL, prompt, options, format=format, timeout=timeout
+                )
+            )
+
+        batch = orjson.loads(resp_text)
+        if not (isinstance(batch, list) and len(batch) == len(documents)
+                and all(isinstance(events, list) for events in batch)):
+            print(f"  Ollama batch: unexpected shape for {len(documents)} documents")
+            return None
+
+        if cached:
+            print(f"  Ollama batch: {sum(map(len, batch))} events from {len(documents)} sources (cached)")
+        else:
+            await cache_response(cache_key, resp_text)
+            duration = time.monotonic() - started
+            print(f"  Ollama batch: {sum(map(len, batch))} events from {len(documents)} sources in {duration:.1f}s")
+        return batch
+
+    except orjson.JSONDecodeError as e:
+        print(f"  Ollama batch JSON error: {e}")
+    except httpx.TimeoutException:
+        print(f"  Ollama batch timeout")
+    except Exception as e:
+        print(f"  Ollama batch error: {e}")
+    return None
+
+
+class OllamaBatcher:
+    """
+    Collects source texts submitted close together and extracts them in one Ollama
+    request. A batch is sent when it reaches max_batch documents or max_wait_ms after
+    its first document; if the batched reply can't be split per document, each
+    document falls back to its own extract_with_ollama call.
+
+    Batches go to Ollama one at a time, since it generates one reply at a time anyway.
+    Pages that finish downloading while a batch is generating queue up behind it and
+    go out together as the next batch, so fetching overlaps extraction.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, max_batch: int = OLLAMA_MAX_BATCH,
+                 max_wait_ms: int = OLLAMA_BATCH_WAIT_MS):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.pending: list[tuple[str, str, asyncio.Future]] = []
+        self.flush_timer: Optional[asyncio.TimerHandle] = None
+        self.generating = asyncio.Lock()
+        self.extractions: set[asyncio.Task] = set()
+
+    async def submit(self, text: str, source_name: str) -> list[dict]:
+        """Queue one source's text for extraction and wait for its events."""
+        if not text or len(text) < 50:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((source_name, text, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_timer is None:
+            self.flush_timer = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self):
+        """Send everything pending, once any batch already generating is done."""
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        if self.pending:
+            # Hold a reference so the task isn't garbage collected mid-request
+            task = asyncio.create_task(self.drain())
+            self.extractions.add(task)
+            task.add_done_callback(self.extractions.discard)
+
+    async def drain(self):
+        """Extract pending documents in batches of up to max_batch, one request at a time."""
+        async with self.generating:
+            while self.pending:
+                batch, self.pending = self.pending[:self.max_batch], self.pending[self.max_batch:]
+                if not self.pending and self.flush_timer is not None:
+                    self.flush_timer.cancel()
+                    self.flush_timer = None
+                await self.extract(batch)
+
+    async def extract(self, batch: list[tuple[str, str, asyncio.Future]]):
+        try:
+            results = None
+            if len(batch) > 1:
+                results = await extract_batch_with_ollama(self.client, [(name, text) for name, text, _ in batch])
+            if results is None:
+                results = await asyncio.gather(
+                    *(extract_with_ollama(self.client, text, name) for name, text, _ in batch)
+                )
+            for (_, _, future), events in zip(batch, results):
+                if not future.done():
+                    future.set_result(events)
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            # A failed batch is reported to its submitters; keep draining the rest
+            if not isinstance(e, Exception):
+                raise
+
+
+async def extract_page_events(
+    client: httpx.AsyncClient, name: str, html: str, selector: Optional[str],
+    batcher: Optional[OllamaBatcher] = None,
+) -> list[dict]:
+    """Reduce a source page to text and extract its events with Ollama."""
+    text = page_text(html, selector)
+
+    print(f"  Content: {len(text)} chars")
+
+    if len(text) < 100:
+        print(f"  Not enough content")
+        return []
+
+    # Reuse the last extraction if the page text hasn't substantively changed
+    embedding = await embed_text(client, text)
+    previous = semantic_cache.get(name)
+    if (embedding is not None and previous is not None and previous[0].shape == embedding.shape
+            and float(previous[0] @ embedding) >= SEMANTIC_CACHE_THRESHOLD):
+        extracted = previous[1]
+        print(f"  Page unchanged, reusing {len(extracted)} extracted events")
+        return extracted
+
+    # Extract with Ollama
+    if batcher:
+        extracted = await batcher.submit(text, name)
+    else:
+        extracted = await extract_with_ollama(client, text, name)
+    if embedding is not None and extracted:
+        semantic_cache[name] = (embedding, extracted)
+    return extracted
+
+
+async def fetch_source_events(
+    client: httpx.AsyncClient, source: dict, batcher: Optional[OllamaBatcher] = None
+) -> list[Event]:
     """Fetch events from a single source using Ollama extraction."""
     events = []
     name = source["name"]
@@ -165,38 +406,37 @@ async def fetch_source_events(source: dict) -> list[Event]:
     print(f"\n[{name}] Fetching {url}")
 
     try:
-        resp = requests.get(
+        validators, previous_hash, previous_events = source_page_cache.get(url, ({}, None, None))
+        resp = await client.get(
             url,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; hub-bot-9000/1.0)"},
+            headers=validators,
+            follow_redirects=True,
             timeout=20
         )
 
-        if resp.status_code != 200:
+        if resp.status_code == 304 and previous_events is not None:
+            extracted = previous_events
+            print(f"  Not modified, reusing {len(extracted)} extracted events")
+        elif resp.status_code != 200:
             print(f"  HTTP {resp.status_code}")
             return []
-
-        soup = BeautifulSoup(resp.text, 'html.parser')
-
-        # Extract text using selector or full body
-        if selector:
-            elements = soup.select(selector)
-            text = ' '.join([e.get_text(separator=' ', strip=True) for e in elements[:15]])
         else:
-            main = soup.select_one('main, article, .content, #content')
-            if main:
-                text = main.get_text(separator=' ', strip=True)
+            body_hash = hashlib.blake2b(resp.content, digest_size=16).digest()
+            if body_hash == previous_hash:
+                # Server ignored the validators, but the page is byte-identical
+                extracted = previous_events
+                print(f"  Body unchanged, reusing {len(extracted)} extracted events")
             else:
-                text = soup.body.get_text(separator=' ', strip=True)[:15000] if soup.body else ""
-
-        print(f"  Content: {len(text)} chars")
-
-        if len(text) < 100:
-            print(f"  Not enough content")
-            return []
-
-        # Extract with Ollama
-        extracted = extract_with_ollama(text, name)
-
+                extracted = await extract_page_events(client, name, resp.text, selector, batcher)
+                if extracted:
+                    validators = {}
+                    if resp.headers.get("etag"):
+                        validators["If-None-Match"] = resp.headers["etag"]
+                    if resp.headers.get("last-modified"):
+                        validators["If-Modified-Since"] = resp.headers["last-modified"]
+                    source_page_cache[url] = (validators, body_hash, extracted)
+
+        submitted_at = datetime.now().isoformat()
         for evt in extracted:
             if evt.get("title"):
                 event = Event(
@@ -207,13 +447,13 @@ async def fetch_source_events(source: dict) -> list[Event]:
                     dateStart=evt.get("date"),
                     location=evt.get("location", "Seattle, WA")[:100] if evt.get("location") else "Seattle, WA",
                     submittedBy=name,
-                    submittedAt=datetime.now().isoformat(),
+                    submittedAt=submitted_at,
                 )
                 events.append(event)
 
         print(f"  Returned {len(events)} events")
 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"  Connection refused")
     except Exception as e:
         print(f"  Error: {e}")
@@ -241,18 +481,20 @@ async def fetch_all_events(sources: list[str] = None) -> list[Event]:
 
     print(f"Fetching events from {len(active_sources)} sources...")
 
-    for source in active_sources:
-        events = await fetch_source_events(source)
+    # Sources are independent, so fetch them concurrently; their texts are
+    # extracted together in batched Ollama requests as they come in
+    client = get_http_client()
+    batcher = OllamaBatcher(client)
+    results = await asyncio.gather(*(fetch_source_events(client, s, batcher) for s in active_sources))
+    for events in results:
         all_events.extend(events)
 
-    # Deduplicate by title similarity
-    seen_titles = set()
-    unique_events = []
+    # Deduplicate by title similarity, keeping each title's first event. Slicing
+    # before lower() only lowercases the 30 chars that form the key
+    first_by_title: dict[str, Event] = {}
     for event in all_events:
-        title_key = event.title.lower()[:30]
-        if title_key not in seen_titles:
-            seen_titles.add(title_key)
-            unique_events.append(event)
+        first_by_title.setdefault(event.title[:30].lower(), event)
+    unique_events = list(first_by_title.values())
 
     print(f"\n{'='*50}")
     print(f"Total: {len(unique_events)} unique events from {len(active_sources)} sources")
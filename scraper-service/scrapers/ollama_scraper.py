@@ -8,54 +8,71 @@ To use:
 3. Set OLLAMA_URL=http://localhost:11434 and OLLAMA_MODEL=llama3.2
 """
 import os
-import json
+import orjson
+import asyncio
 import hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 import httpx
 
 from models import Event
+from scrapers.html_text import page_text
+from scrapers.llm_cache import llm_cache_key, get_cached_response, cache_response
+from scrapers.llm_response import EVENT_ARRAY_FORMAT, EVENT_ARRAY_SCHEMA, strip_markdown_fence, stream_ollama_generate
 
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2")
+MAX_CONCURRENT_SOURCES = 2  # Ollama generations in flight at once
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Client shared by every call in this module, so Ollama and source connections are kept alive."""
+    return httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_keepalive_connections=32))
+
+
+async def close_http_client():
+    """Close the shared client if one was created; the app calls this on shutdown."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
 
 
 async def check_ollama_available() -> bool:
     """Check if Ollama is running and available."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{OLLAMA_URL}/api/tags")
-            return response.status_code == 200
+        response = await get_http_client().get(f"{OLLAMA_URL}/api/tags", timeout=5.0)
+        return response.status_code == 200
     except Exception:
         return False
 
 
-async def query_ollama(prompt: str, model: str = None) -> Optional[str]:
-    """Query Ollama with a prompt and return the response."""
+async def query_ollama(prompt: str, model: str = None, format=None) -> tuple[Optional[str], Optional[str]]:
+    """
+    Query Ollama with a prompt and return (response, cache_key); repeated prompts are
+    served from the LLM cache. A fresh reply isn't cached here: cache_key is set only
+    for one, and the caller stores it with cache_response once the reply has parsed.
+    `format` ("json" or a JSON schema) constrains the reply to that JSON.
+    """
     model = model or OLLAMA_MODEL
+    options = {
+        "temperature": 0.1,
+        "num_predict": 4096,
+    }
+    cache_key = llm_cache_key(model, prompt, format=format, **options)
 
-    try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,
-                        "num_predict": 4096,
-                    }
-                }
-            )
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return cached, None
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("response", "")
+    try:
+        text = await stream_ollama_generate(get_http_client(), OLLAMA_URL, model, prompt, options, format=format)
+        return text, cache_key
     except Exception as e:
         print(f"Ollama query error: {type(e).__name__}: {e}")
 
-    return None
+    return None, None
 
 
 async def extract_events_with_ollama(
@@ -69,59 +86,50 @@ async def extract_events_with_ollama(
     """
     events = []
 
-    # Truncate HTML to avoid overwhelming the model
-    html_snippet = html_content[:15000]
+    # Send the page's text rather than raw HTML: markup is most of the bytes and
+    # tokens, so more event content fits in the same window
+    text_snippet = page_text(html_content, None)[:10000]
 
-    prompt = f"""Extract event information from this HTML content from {source_name}.
+    prompt = f"""Extract event information from this page text from {source_name}.
 
-HTML:
-{html_snippet}
+Text:
+{text_snippet}
 
 Return ONLY a JSON array with this exact format (no markdown, no explanation):
-[
-  {{
-    "title": "Event Name",
-    "date": "YYYY-MM-DD",
-    "location": "Venue Name",
-    "url": "https://...",
-    "description": "Brief description"
-  }}
-]
+{EVENT_ARRAY_FORMAT}
 
 Only include actual events, not navigation or other content.
 If no events found, return: []"""
 
-    response = await query_ollama(prompt, model)
+    response, cache_key = await query_ollama(prompt, model, format=EVENT_ARRAY_SCHEMA)
 
     if response:
         # Clean up response
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+        text = strip_markdown_fence(response)
 
         try:
             if text.startswith("["):
-                events_data = json.loads(text)
+                events_data = orjson.loads(text)
+                if cache_key:
+                    await cache_response(cache_key, response)
+                submitted_at = datetime.now().isoformat()
 
                 for evt in events_data:
                     if evt.get("title") and evt.get("date"):
                         event = Event(
-                            id=f"ollama_{hashlib.md5((evt['title'] + evt['date']).encode()).hexdigest()[:8]}",
+                            id=f"ollama_{hashlib.blake2b((evt['title'] + evt['date']).encode(), digest_size=4).hexdigest()}",
                             title=evt["title"][:150],
                             description=evt.get("description", "")[:200] if evt.get("description") else None,
                             url=evt.get("url", source_url),
                             dateStart=evt["date"],
                             location=evt.get("location", "")[:100] if evt.get("location") else None,
                             submittedBy=source_name,
-                            submittedAt=datetime.now().isoformat(),
+                            submittedAt=submitted_at,
                         )
                         events.append(event)
 
                 print(f"Ollama: {source_name} returned {len(events)} events")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Ollama JSON parse error for {source_name}: {e}")
 
     return events
@@ -156,30 +164,39 @@ async def fetch_events_with_ollama(location: str = "Seattle", days: int = 7) ->
         },
     ]
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for source in sources:
-            try:
-                response = await client.get(
-                    source["url"],
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                        "Accept": "text/html,application/xhtml+xml",
-                    },
-                    follow_redirects=True
-                )
-
-                if response.status_code == 200:
-                    events = await extract_events_with_ollama(
+    # Pages download concurrently; only the extraction waits on the semaphore
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+
+    async def fetch_source(source: dict) -> list[Event]:
+        try:
+            response = await get_http_client().get(
+                source["url"],
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                    "Accept": "text/html,application/xhtml+xml",
+                },
+                follow_redirects=True,
+                timeout=30.0
+            )
+
+            if response.status_code == 200:
+                async with semaphore:
+                    return await extract_events_with_ollama(
                         response.text,
                         source["name"],
                         source["url"]
                     )
-                    all_events.extend(events)
-                else:
-                    print(f"Ollama: {source['name']} returned {response.status_code}")
+            print(f"Ollama: {source['name']} returned {response.status_code}")
+
+        except Exception as e:
+            print(f"Ollama: Error fetching {source['name']}: {type(e).__name__}")
+        return []
 
-            except Exception as e:
-                print(f"Ollama: Error fetching {source['name']}: {type(e).__name__}")
+    # fetch_source handles its own errors, so no task can fail the group
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(fetch_source(s)) for s in sources]
+    for task in tasks:
+        all_events.extend(task.result())
 
     return all_events
 
@@ -215,20 +232,18 @@ Definitions:
 - adversarial: Critical, negative, attacking the community
 - hateful: Contains slurs, threats, or extreme hostility"""
 
-    response = await query_ollama(prompt, model)
+    response, cache_key = await query_ollama(prompt, model, format="json")
 
     if response:
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        text = text.strip()
+        text = strip_markdown_fence(response)
 
         try:
             if text.startswith("{"):
-                return json.loads(text)
-        except json.JSONDecodeError:
+                tone = orjson.loads(text)
+                if cache_key:
+                    await cache_response(cache_key, response)
+                return tone
+        except orjson.JSONDecodeError:
             pass
 
     return None
@@ -2,16 +2,29 @@
 Direct web scrapers for Seattle event sources.
 No AI required - uses BeautifulSoup for HTML parsing.
 """
+import codecs
 import hashlib
-import json
+import orjson
+import random
 import re
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+from functools import lru_cache
+from urllib.parse import urlparse
 import asyncio
 import httpx
 from bs4 import BeautifulSoup
+from cachetools import LRUCache
+
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # Optional - falls back to HTTP/1.1
+    HTTP2_AVAILABLE = False
 
 from models import Event
+from deduplication import normalize_title
 
 HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -19,8 +32,283 @@ HTTP_HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
-# Polite delay between requests to different sites (seconds)
-POLITE_DELAY = 2.0
+# Events kept per site; parsing stops once a page has yielded this many
+SITE_EVENT_LIMIT = 10
+
+# JSON-LD script blocks, found by scanning the page bytes; a tree is only built when a
+# page has no JSON-LD events and its HTML cards are needed
+JSONLD_SCRIPT_PATTERN = re.compile(
+    rb'<script[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+# Patterns for the HTML fallbacks, compiled once rather than on every scrape
+EVEROUT_EVENT_HREF_PATTERN = re.compile(r'/seattle/events/[^/]+')
+EVENT_CARD_CLASS_PATTERN = re.compile(r'event|card', re.I)
+EVENT_ARTICLE_CLASS_PATTERN = re.compile(r'event|article|card', re.I)
+EVENT_CLASS_PATTERN = re.compile(r'event', re.I)
+
+
+def event_id_hash(key: str) -> str:
+    """8-hex-digit hash for event IDs; blake2b yields exactly 4 bytes instead of truncating an MD5 digest."""
+    return hashlib.blake2b(key.encode(), digest_size=4).hexdigest()
+
+
+def event_signature(event: Event) -> tuple:
+    """Normalized title and start date, which identify an event across listings."""
+    return normalize_title(event.title), event.dateStart
+
+
+def fields_signature(fields: dict) -> tuple:
+    """event_signature for parsed fields; undated listings all fall on the same day."""
+    return normalize_title(fields['title']), fields.get('dateStart')
+
+
+def unique_events(
+    events: Iterable, seen: Optional[set] = None, limit: Optional[int] = None, key: Callable = event_signature
+) -> list:
+    """
+    Events whose normalized title and start date haven't been seen yet (in `seen`, if
+    given). Stops consuming `events` once `limit` are found. `key` gives the signature,
+    for events still held as field dicts.
+    """
+    seen = set() if seen is None else seen
+    unique = []
+    for event in events:
+        signature = key(event)
+        if signature not in seen:
+            seen.add(signature)
+            unique.append(event)
+            if len(unique) == limit:
+                break
+    return unique
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Client shared by every scrape, so connections to each site are kept alive between
+    runs. Idle connections are held for 30s rather than httpx's 5s, so a reused
+    connection also skips the DNS lookup and TLS handshake of a new one.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0),
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0),
+        headers=HTTP_HEADERS,
+        follow_redirects=True,
+    )
+
+
+async def close_http_client():
+    """Close the shared client if one was created; the app calls this on shutdown."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+
+
+# Requests per second allowed to any one site. Each site has its own budget, so
+# scraping different sites at the same time isn't throttled
+HOST_REQUEST_RATE = 0.5
+
+# Attempts per page fetch; dropped connections and timeouts are retried with backoff
+FETCH_ATTEMPTS = 3
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError)
+
+# Seconds each site gets, retries included, before its scrape is abandoned
+SITE_TIMEOUT = 30
+
+
+class RateLimiter:
+    """Token bucket for one host: `rate` requests per second, in bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the host's budget allows another request, then spend it."""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.last_refill = time.monotonic()
+            self.tokens -= 1
+
+
+host_limiters: dict[str, RateLimiter] = {}
+
+
+async def polite_get(client: httpx.AsyncClient, url: str, headers: Optional[dict] = None) -> httpx.Response:
+    """
+    GET a page once its host's rate limit allows. Connection failures and timeouts are
+    retried with exponential backoff; the last one is raised.
+    """
+    host = urlparse(url).netloc
+    if host not in host_limiters:
+        host_limiters[host] = RateLimiter(HOST_REQUEST_RATE)
+    for attempt in range(FETCH_ATTEMPTS):
+        await host_limiters[host].acquire()
+        try:
+            return await client.get(url, headers=headers)
+        except RETRYABLE_ERRORS as e:
+            if attempt == FETCH_ATTEMPTS - 1:
+                raise
+            print(f"{host}: {type(e).__name__}, retrying")
+        await asyncio.sleep(2 ** attempt + random.random())
+
+
+# Page URL -> (conditional GET headers, body hash, parsed event fields) from the last
+# scrape that found events; a 304 or identical body skips downloading or parsing it
+# again. Fields are cached rather than Events so submittedAt and the placeholder
+# dateStart of undated listings are stamped on every scrape, not the day it was parsed
+page_cache = LRUCache(maxsize=16)
+
+
+async def fetch_page_events(client: httpx.AsyncClient, url: str, parse, *args) -> tuple[int, list[Event]]:
+    """
+    Fetch a page and take the first SITE_EVENT_LIMIT distinct events from the generator
+    parse(body, encoding, *args); returns the HTTP status and the events. Unchanged
+    pages reuse the event fields parsed last time.
+    """
+    validators, previous_hash, previous_fields = page_cache.get(url, ({}, None, None))
+    response = await polite_get(client, url, headers=validators)
+
+    if response.status_code == 304 and previous_fields is not None:
+        return 200, build_events(previous_fields)
+    if response.status_code != 200:
+        return response.status_code, []
+
+    body_hash = hashlib.blake2b(response.content, digest_size=16).digest()
+    if body_hash == previous_hash:
+        # Server ignored the validators, but the page is byte-identical
+        return 200, build_events(previous_fields)
+
+    # Parsing is CPU-bound; run it in a worker thread so the other sites'
+    # downloads aren't stalled behind it
+    # The parser gets the raw bytes and decodes them itself, so the page isn't
+    # decoded once by httpx for response.text and again by the parser
+    fields = await asyncio.to_thread(take_events, parse, response.content, response.charset_encoding, *args)
+    if fields:
+        validators = {}
+        if response.headers.get("etag"):
+            validators["If-None-Match"] = response.headers["etag"]
+        if response.headers.get("last-modified"):
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        page_cache[url] = (validators, body_hash, fields)
+    return 200, build_events(fields)
+
+
+def take_events(parse, *args) -> list[dict]:
+    """Run a page parser only until it has yielded SITE_EVENT_LIMIT distinct events."""
+    return unique_events(parse(*args), limit=SITE_EVENT_LIMIT, key=fields_signature)
+
+
+def build_events(fields: list[dict]) -> list[Event]:
+    """Events from parsed fields, submitted now; listings without a date are dated today."""
+    now = datetime.now()
+    submitted_at = now.isoformat()
+    today = now.strftime("%Y-%m-%d")
+    return [Event(**{"dateStart": today, **event}, submittedAt=submitted_at) for event in fields]
+
+
+def iter_jsonld_events(html: bytes, encoding: Optional[str]) -> Iterator[dict]:
+    """
+    Every JSON-LD Event object on a page, whether it's a script's whole content, an
+    entry in a top-level array, or an item of an ItemList.
+    """
+    # orjson reads UTF-8 only; blocks from pages in other charsets are decoded first
+    try:
+        transcode = encoding is not None and codecs.lookup(encoding).name != 'utf-8'
+    except LookupError:  # Unknown charset label; treat the page as UTF-8
+        transcode = False
+    for match in JSONLD_SCRIPT_PATTERN.finditer(html):
+        block = match.group(1)
+        try:
+            data = orjson.loads(block.decode(encoding, 'replace') if transcode else block)
+        except orjson.JSONDecodeError:
+            continue
+        for entry in data if isinstance(data, list) else [data]:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get('@type') == 'ItemList':
+                candidates = [item.get('item') for item in entry.get('itemListElement', []) if isinstance(item, dict)]
+            else:
+                candidates = [entry]
+            for candidate in candidates:
+                if isinstance(candidate, dict) and candidate.get('@type') == 'Event':
+                    yield candidate
+
+
+def jsonld_event(
+    data: dict, prefix: str, source: str, page_url: str, location: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Event fields from a JSON-LD Event object, or None without a name and start date.
+    `location` overrides the object's own venue, for single-venue sources.
+    """
+    # Each field is looked up once; `or` also covers keys present with a null value
+    name = data.get('name') or ''
+    date_start = (data.get('startDate') or '')[:10]
+    if not name or not date_start:
+        return None
+    if not location:
+        location_data = data.get('location')
+        location = (location_data.get('name') or '')[:100] if isinstance(location_data, dict) else None
+    event_url = data.get('url')
+    description = data.get('description')
+
+    return dict(
+        id=f"{prefix}_{event_id_hash(event_url or name)}",
+        title=name[:150],
+        description=description[:200] if description else None,
+        url=event_url or page_url,
+        dateStart=date_start,
+        location=location or None,
+        submittedBy=source,
+    )
+
+
+def parse_everout_events(html: bytes, encoding: Optional[str], url: str) -> Iterator[dict]:
+    """Yield the event fields on a fetched EverOut page, parsing only as far as the caller reads."""
+
+    # Look for JSON-LD structured data
+    found = False
+    for data in iter_jsonld_events(html, encoding):
+        event = jsonld_event(data, "everout", "EverOut Seattle", url)
+        if event:
+            found = True
+            yield event
+
+    # Fallback: Parse event cards from HTML if no JSON-LD
+    if not found:
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        event_links = soup.find_all('a', href=EVEROUT_EVENT_HREF_PATTERN)
+        seen_urls = set()
+
+        for link in event_links[:20]:
+            href = link.get('href', '')
+            if href in seen_urls or not href:
+                continue
+            seen_urls.add(href)
+
+            title = link.get_text(strip=True)
+            if not title or len(title) < 3:
+                continue
+
+            full_url = f"https://everout.com{href}" if href.startswith('/') else href
+
+            yield dict(
+                id=f"everout_{event_id_hash(full_url)}",
+                title=title[:150],
+                url=full_url,
+                submittedBy="EverOut Seattle",
+            )
 
 
 async def scrape_everout_seattle(client: httpx.AsyncClient, days: int = 7) -> list[Event]:
@@ -33,72 +321,50 @@ async def scrape_everout_seattle(client: httpx.AsyncClient, days: int = 7) -> li
         url = "https://everout.com/seattle/events/"
         print(f"Fetching EverOut: {url}")
 
-        response = await client.get(url, headers=HTTP_HEADERS, follow_redirects=True, timeout=30.0)
+        status, events = await fetch_page_events(client, url, parse_everout_events, url)
 
-        if response.status_code != 200:
-            print(f"EverOut returned {response.status_code}")
+        if status != 200:
+            print(f"EverOut returned {status}")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for JSON-LD structured data
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'ItemList':
-                    for item in data.get('itemListElement', []):
-                        event_data = item.get('item', {})
-                        if event_data.get('@type') == 'Event':
-                            date_start = event_data.get('startDate', '')[:10] if event_data.get('startDate') else ''
-                            location_data = event_data.get('location', {})
-                            location_name = location_data.get('name', '') if isinstance(location_data, dict) else ''
-
-                            event = Event(
-                                id=f"everout_{hashlib.md5(event_data.get('url', '').encode()).hexdigest()[:8]}",
-                                title=event_data.get('name', '')[:150],
-                                description=event_data.get('description', '')[:200] if event_data.get('description') else None,
-                                url=event_data.get('url', ''),
-                                dateStart=date_start,
-                                location=location_name[:100] if location_name else None,
-                                submittedBy="EverOut Seattle",
-                                submittedAt=datetime.now().isoformat(),
-                            )
-                            if event.title and event.dateStart:
-                                events.append(event)
-            except json.JSONDecodeError:
-                continue
-
-        # Fallback: Parse event cards from HTML if no JSON-LD
-        if not events:
-            event_links = soup.find_all('a', href=re.compile(r'/seattle/events/[^/]+'))
-            seen_urls = set()
-
-            for link in event_links[:20]:
-                href = link.get('href', '')
-                if href in seen_urls or not href:
-                    continue
-                seen_urls.add(href)
-
-                title = link.get_text(strip=True)
-                if not title or len(title) < 3:
-                    continue
-
-                full_url = f"https://everout.com{href}" if href.startswith('/') else href
-
-                events.append(Event(
-                    id=f"everout_{hashlib.md5(full_url.encode()).hexdigest()[:8]}",
-                    title=title[:150],
-                    url=full_url,
-                    dateStart=datetime.now().strftime("%Y-%m-%d"),  # Placeholder
-                    submittedBy="EverOut Seattle",
-                    submittedAt=datetime.now().isoformat(),
-                ))
-
         print(f"EverOut: extracted {len(events)} events")
     except Exception as e:
         print(f"EverOut scraper error: {type(e).__name__}: {e}")
 
-    return events[:10]
+    return events
+
+
+def parse_mopop_events(html: bytes, encoding: Optional[str], url: str) -> Iterator[dict]:
+    """Yield the event fields on a fetched MoPOP page, parsing only as far as the caller reads."""
+
+    # Look for JSON-LD
+    found = False
+    for data in iter_jsonld_events(html, encoding):
+        event = jsonld_event(data, "mopop", "MoPOP", url, location="MoPOP")
+        if event:
+            found = True
+            yield event
+
+    # Fallback: Look for event cards in HTML
+    if not found:
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        # Look for common event card patterns
+        for card in soup.find_all(['article', 'div'], class_=EVENT_CARD_CLASS_PATTERN):
+            title_el = card.find(['h2', 'h3', 'h4', 'a'])
+            if title_el:
+                title = title_el.get_text(strip=True)
+                link = card.find('a', href=True)
+                href = link.get('href', '') if link else ''
+
+                if title and len(title) > 3:
+                    full_url = f"https://www.mopop.org{href}" if href.startswith('/') else (href or url)
+                    yield dict(
+                        id=f"mopop_{event_id_hash(full_url)}",
+                        title=title[:150],
+                        url=full_url,
+                        location="MoPOP",
+                        submittedBy="MoPOP",
+                    )
 
 
 async def scrape_mopop(client: httpx.AsyncClient, days: int = 7) -> list[Event]:
@@ -110,74 +376,52 @@ async def scrape_mopop(client: httpx.AsyncClient, days: int = 7) -> list[Event]:
         url = "https://www.mopop.org/events"
         print(f"Fetching MoPOP: {url}")
 
-        response = await client.get(url, headers=HTTP_HEADERS, follow_redirects=True, timeout=30.0)
+        status, events = await fetch_page_events(client, url, parse_mopop_events, url)
 
-        if response.status_code != 200:
-            print(f"MoPOP returned {response.status_code}")
+        if status != 200:
+            print(f"MoPOP returned {status}")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for JSON-LD
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    for item in data:
-                        if item.get('@type') == 'Event':
-                            date_start = item.get('startDate', '')[:10] if item.get('startDate') else ''
-                            events.append(Event(
-                                id=f"mopop_{hashlib.md5(item.get('url', item.get('name', '')).encode()).hexdigest()[:8]}",
-                                title=item.get('name', '')[:150],
-                                description=item.get('description', '')[:200] if item.get('description') else None,
-                                url=item.get('url', url),
-                                dateStart=date_start,
-                                location="MoPOP",
-                                submittedBy="MoPOP",
-                                submittedAt=datetime.now().isoformat(),
-                            ))
-                elif data.get('@type') == 'Event':
-                    date_start = data.get('startDate', '')[:10] if data.get('startDate') else ''
-                    events.append(Event(
-                        id=f"mopop_{hashlib.md5(data.get('url', data.get('name', '')).encode()).hexdigest()[:8]}",
-                        title=data.get('name', '')[:150],
-                        description=data.get('description', '')[:200] if data.get('description') else None,
-                        url=data.get('url', url),
-                        dateStart=date_start,
-                        location="MoPOP",
-                        submittedBy="MoPOP",
-                        submittedAt=datetime.now().isoformat(),
-                    ))
-            except json.JSONDecodeError:
-                continue
-
-        # Fallback: Look for event cards in HTML
-        if not events:
-            # Look for common event card patterns
-            for card in soup.find_all(['article', 'div'], class_=re.compile(r'event|card', re.I)):
-                title_el = card.find(['h2', 'h3', 'h4', 'a'])
-                if title_el:
-                    title = title_el.get_text(strip=True)
-                    link = card.find('a', href=True)
-                    href = link.get('href', '') if link else ''
-
-                    if title and len(title) > 3:
-                        full_url = f"https://www.mopop.org{href}" if href.startswith('/') else (href or url)
-                        events.append(Event(
-                            id=f"mopop_{hashlib.md5(full_url.encode()).hexdigest()[:8]}",
-                            title=title[:150],
-                            url=full_url,
-                            dateStart=datetime.now().strftime("%Y-%m-%d"),
-                            location="MoPOP",
-                            submittedBy="MoPOP",
-                            submittedAt=datetime.now().isoformat(),
-                        ))
-
         print(f"MoPOP: extracted {len(events)} events")
     except Exception as e:
         print(f"MoPOP scraper error: {type(e).__name__}: {e}")
 
-    return events[:10]
+    return events
+
+
+def parse_seattle_met_events(html: bytes, encoding: Optional[str], url: str) -> Iterator[dict]:
+    """Yield the event fields on a fetched Seattle Met page, parsing only as far as the caller reads."""
+
+    # Look for JSON-LD
+    found = False
+    for data in iter_jsonld_events(html, encoding):
+        event = jsonld_event(data, "seattlemet", "Seattle Met", url)
+        if event:
+            found = True
+            yield event
+
+    # Fallback: Look for article cards
+    if not found:
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        for article in soup.find_all(['article', 'div'], class_=EVENT_ARTICLE_CLASS_PATTERN):
+            title_el = article.find(['h2', 'h3', 'h4'])
+            if title_el:
+                title = title_el.get_text(strip=True)
+                link = article.find('a', href=True)
+                href = link.get('href', '') if link else ''
+
+                # Skip navigation items
+                if any(x in title.lower() for x in ['menu', 'search', 'subscribe', 'newsletter']):
+                    continue
+
+                if title and len(title) > 5:
+                    full_url = f"https://www.seattlemet.com{href}" if href.startswith('/') else (href or url)
+                    yield dict(
+                        id=f"seattlemet_{event_id_hash(full_url)}",
+                        title=title[:150],
+                        url=full_url,
+                        submittedBy="Seattle Met",
+                    )
 
 
 async def scrape_seattle_met(client: httpx.AsyncClient, days: int = 7) -> list[Event]:
@@ -189,64 +433,54 @@ async def scrape_seattle_met(client: httpx.AsyncClient, days: int = 7) -> list[E
         url = "https://www.seattlemet.com/arts-and-culture/things-to-do-in-seattle-events"
         print(f"Fetching Seattle Met: {url}")
 
-        response = await client.get(url, headers=HTTP_HEADERS, follow_redirects=True, timeout=30.0)
+        status, events = await fetch_page_events(client, url, parse_seattle_met_events, url)
 
-        if response.status_code != 200:
-            print(f"Seattle Met returned {response.status_code}")
+        if status != 200:
+            print(f"Seattle Met returned {status}")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for JSON-LD
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'ItemList':
-                    for item in data.get('itemListElement', []):
-                        event_data = item.get('item', {})
-                        if event_data.get('@type') == 'Event':
-                            date_start = event_data.get('startDate', '')[:10] if event_data.get('startDate') else ''
-                            events.append(Event(
-                                id=f"seattlemet_{hashlib.md5(event_data.get('url', '').encode()).hexdigest()[:8]}",
-                                title=event_data.get('name', '')[:150],
-                                description=event_data.get('description', '')[:200] if event_data.get('description') else None,
-                                url=event_data.get('url', url),
-                                dateStart=date_start,
-                                submittedBy="Seattle Met",
-                                submittedAt=datetime.now().isoformat(),
-                            ))
-            except json.JSONDecodeError:
-                continue
-
-        # Fallback: Look for article cards
-        if not events:
-            for article in soup.find_all(['article', 'div'], class_=re.compile(r'event|article|card', re.I)):
-                title_el = article.find(['h2', 'h3', 'h4'])
-                if title_el:
-                    title = title_el.get_text(strip=True)
-                    link = article.find('a', href=True)
-                    href = link.get('href', '') if link else ''
-
-                    # Skip navigation items
-                    if any(x in title.lower() for x in ['menu', 'search', 'subscribe', 'newsletter']):
-                        continue
-
-                    if title and len(title) > 5:
-                        full_url = f"https://www.seattlemet.com{href}" if href.startswith('/') else (href or url)
-                        events.append(Event(
-                            id=f"seattlemet_{hashlib.md5(full_url.encode()).hexdigest()[:8]}",
-                            title=title[:150],
-                            url=full_url,
-                            dateStart=datetime.now().strftime("%Y-%m-%d"),
-                            submittedBy="Seattle Met",
-                            submittedAt=datetime.now().isoformat(),
-                        ))
-
         print(f"Seattle Met: extracted {len(events)} events")
     except Exception as e:
         print(f"Seattle Met scraper error: {type(e).__name__}: {e}")
 
-    return events[:10]
+    return events
+
+
+def parse_seattle_gov_events(html: bytes, encoding: Optional[str], url: str) -> Iterator[dict]:
+    """Yield the event fields on a fetched Seattle.gov page, parsing only as far as the caller reads."""
+
+    # Look for JSON-LD
+    found = False
+    for data in iter_jsonld_events(html, encoding):
+        event = jsonld_event(data, "seattlegov", "Seattle.gov", url)
+        if event:
+            found = True
+            yield event
+
+    # Fallback: Look for event listings
+    if not found:
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        for item in soup.find_all(['a', 'div', 'li'], class_=EVENT_CLASS_PATTERN):
+            title = item.get_text(strip=True)
+            href = item.get('href', '') if item.name == 'a' else ''
+
+            if not href:
+                link = item.find('a', href=True)
+                href = link.get('href', '') if link else ''
+
+            # Skip if too short or looks like navigation
+            if not title or len(title) < 5 or len(title) > 150:
+                continue
+            if any(x in title.lower() for x in ['more events', 'view all', 'calendar']):
+                continue
+
+            full_url = f"https://www.seattle.gov{href}" if href.startswith('/') else (href or url)
+            yield dict(
+                id=f"seattlegov_{event_id_hash(full_url)}",
+                title=title[:150],
+                url=full_url,
+                submittedBy="Seattle.gov",
+            )
 
 
 async def scrape_seattle_gov(client: httpx.AsyncClient, days: int = 7) -> list[Event]:
@@ -258,102 +492,46 @@ async def scrape_seattle_gov(client: httpx.AsyncClient, days: int = 7) -> list[E
         url = "https://www.seattle.gov/event-calendar"
         print(f"Fetching Seattle.gov: {url}")
 
-        response = await client.get(url, headers=HTTP_HEADERS, follow_redirects=True, timeout=30.0)
+        status, events = await fetch_page_events(client, url, parse_seattle_gov_events, url)
 
-        if response.status_code != 200:
-            print(f"Seattle.gov returned {response.status_code}")
+        if status != 200:
+            print(f"Seattle.gov returned {status}")
             return events
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for JSON-LD
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Event':
-                    date_start = data.get('startDate', '')[:10] if data.get('startDate') else ''
-                    events.append(Event(
-                        id=f"seattlegov_{hashlib.md5(data.get('url', data.get('name', '')).encode()).hexdigest()[:8]}",
-                        title=data.get('name', '')[:150],
-                        description=data.get('description', '')[:200] if data.get('description') else None,
-                        url=data.get('url', url),
-                        dateStart=date_start,
-                        submittedBy="Seattle.gov",
-                        submittedAt=datetime.now().isoformat(),
-                    ))
-            except json.JSONDecodeError:
-                continue
-
-        # Fallback: Look for event listings
-        if not events:
-            for item in soup.find_all(['a', 'div', 'li'], class_=re.compile(r'event', re.I)):
-                title = item.get_text(strip=True)
-                href = item.get('href', '') if item.name == 'a' else ''
-
-                if not href:
-                    link = item.find('a', href=True)
-                    href = link.get('href', '') if link else ''
-
-                # Skip if too short or looks like navigation
-                if not title or len(title) < 5 or len(title) > 150:
-                    continue
-                if any(x in title.lower() for x in ['more events', 'view all', 'calendar']):
-                    continue
-
-                full_url = f"https://www.seattle.gov{href}" if href.startswith('/') else (href or url)
-                events.append(Event(
-                    id=f"seattlegov_{hashlib.md5(full_url.encode()).hexdigest()[:8]}",
-                    title=title[:150],
-                    url=full_url,
-                    dateStart=datetime.now().strftime("%Y-%m-%d"),
-                    submittedBy="Seattle.gov",
-                    submittedAt=datetime.now().isoformat(),
-                ))
-
         print(f"Seattle.gov: extracted {len(events)} events")
     except Exception as e:
         print(f"Seattle.gov scraper error: {type(e).__name__}: {e}")
 
-    return events[:10]
+    return events
 
 
 async def fetch_all_seattle_events(days: int = 7) -> list[Event]:
     """
     Fetch events from all Seattle sources.
-    Includes polite delays between requests to respect rate limits.
+    Each source is a different site, so they are scraped concurrently.
     """
     all_events = []
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Fetch from all sources with polite delays between each
-        try:
-            everout = await scrape_everout_seattle(client, days)
-            all_events.extend(everout)
-        except Exception as e:
-            print(f"EverOut failed: {e}")
-
-        await asyncio.sleep(POLITE_DELAY)
-
-        try:
-            mopop = await scrape_mopop(client, days)
-            all_events.extend(mopop)
-        except Exception as e:
-            print(f"MoPOP failed: {e}")
-
-        await asyncio.sleep(POLITE_DELAY)
-
-        try:
-            seattle_met = await scrape_seattle_met(client, days)
-            all_events.extend(seattle_met)
-        except Exception as e:
-            print(f"Seattle Met failed: {e}")
-
-        await asyncio.sleep(POLITE_DELAY)
-
-        try:
-            seattle_gov = await scrape_seattle_gov(client, days)
-            all_events.extend(seattle_gov)
-        except Exception as e:
-            print(f"Seattle.gov failed: {e}")
+    client = get_http_client()
+    scrapers = {
+        "EverOut": scrape_everout_seattle,
+        "MoPOP": scrape_mopop,
+        "Seattle Met": scrape_seattle_met,
+        "Seattle.gov": scrape_seattle_gov,
+    }
+
+    async def scrape_site(scrape) -> list[Event]:
+        async with asyncio.timeout(SITE_TIMEOUT):
+            return await scrape(client, days)
+
+    results = await asyncio.gather(*(scrape_site(s) for s in scrapers.values()), return_exceptions=True)
+
+    # Sources list some of the same events; keep the first listing of each
+    seen = set()
+    for name, result in zip(scrapers, results):
+        if isinstance(result, BaseException):
+            print(f"{name} failed: {type(result).__name__}: {result}")
+        else:
+            all_events.extend(unique_events(result, seen))
 
     return all_events
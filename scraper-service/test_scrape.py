@@ -1,77 +1,246 @@
 """Quick test of scraping sources - look for APIs."""
+import asyncio
+import codecs
+import random
 import httpx
-from bs4 import BeautifulSoup
-import json
+from cachetools import LRUCache
+from lxml import etree, html as lxml_html
+import orjson
 import re
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Optional
+
+try:
+    import uvloop
+except ImportError:  # e.g. Windows; the stock asyncio loop just runs a little slower
+    uvloop = None
+
+
+@dataclass(slots=True, frozen=True)
+class Source:
+    name: str
+    url: str
+
+
+SOURCES = (
+    Source("EverOut API", "https://everout.com/api/events/?location=seattle&page=1"),
+    Source("Seattle.gov Calendar", "https://www.seattle.gov/event-calendar/public-outreach-and-engagement-calendar"),
+    Source("Visit Seattle", "https://visitseattle.org/events/"),
+    Source("Seattle Times", "https://www.seattletimes.com/things-to-do/"),
+    Source("Stranger Things To Do", "https://www.thestranger.com/things-to-do"),
+)
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/json,application/xhtml+xml",
+}
+BAR = '=' * 60
+
+MAX_CONCURRENT_REQUESTS = 8
+FETCH_ATTEMPTS = 4
+MAX_RETRY_AFTER = 30  # seconds; a longer Retry-After falls back to backoff rather than stall the run
+RETRY_STATUSES = {429, 503}  # rate limited / temporarily down: worth asking again
+MAX_BODY_BYTES = 512_000  # the page stats only need the start of a page; JSON is read whole
+
+# JSON-LD script blocks, found by scanning the body bytes rather than the parsed tree
+JSONLD_SCRIPT_PATTERN = re.compile(
+    rb'<script[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+# Everything the page stats count, in one walk done by libxml2
+STATS_XPATH = etree.XPath('//*[self::h2 or self::h3 or @data-events]')
+# A node's text with runs of whitespace collapsed to one space, done in C
+NORMALIZED_TEXT_XPATH = etree.XPath('normalize-space()')
+# A heading line of 6-99 characters: long enough to be a title, short enough not to be a paragraph
+HEADING_LINE_PATTERN = re.compile(r'^.{6,99}$', re.MULTILINE)
+# Without an explicit encoding lxml assumes Latin-1 for pages lacking a charset <meta>
+UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Source URL -> (conditional GET headers, report lines) from the last 200; when the
+# probe is rerun in the same process, a 304 reuses the report without a download
+report_cache = LRUCache(maxsize=16)
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before the next attempt: the server's Retry-After if given and short, else backoff."""
+    retry_after = response.headers.get('retry-after', '') if response is not None else ''
+    if retry_after.isdigit() and int(retry_after) <= MAX_RETRY_AFTER:
+        return float(retry_after)
+    return 2 ** attempt + random.random()
+
+
+def is_json_media_type(content_type: str) -> bool:
+    """True for application/json and +json types like EverOut's vnd.api+json, ignoring parameters."""
+    media_type = content_type.partition(';')[0].strip().lower()
+    return media_type == 'application/json' or media_type.endswith('+json')
+
+
+async def read_capped(response: httpx.Response) -> bytes:
+    """
+    Read a streamed body, then close the response. Pages stop at MAX_BODY_BYTES; JSON is
+    read in full, since a cut-off document won't decode. Only 200 bodies get reported
+    on, so error pages are closed without downloading them.
+    """
+    chunks = []
+    total = 0
+    try:
+        if response.status_code != 200:
+            return b""
+        if is_json_media_type(response.headers.get('content-type', '')):
+            return await response.aread()
+        async for chunk in response.aiter_bytes(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_BODY_BYTES:
+                break
+    finally:
+        await response.aclose()
+    return b"".join(chunks)[:MAX_BODY_BYTES]
+
+
+async def fetch(
+    client: httpx.AsyncClient, url: str, headers: dict, lines: list[str]
+) -> tuple[httpx.Response, bytes]:
+    """
+    GET a source, retrying transport errors and 429/503 responses with backoff. The
+    last response and its (capped) body are returned, or the last error raised, once
+    attempts run out.
+    """
+    for attempt in range(FETCH_ATTEMPTS):
+        response = None
+        try:
+            async with request_slots:
+                response = await client.send(client.build_request("GET", url, headers=headers), stream=True)
+                body = await read_capped(response)
+            if response.status_code not in RETRY_STATUSES or attempt == FETCH_ATTEMPTS - 1:
+                return response, body
+            lines.append(f"Retrying after HTTP {response.status_code}")
+        except httpx.TransportError as e:
+            if attempt == FETCH_ATTEMPTS - 1:
+                raise
+            lines.append(f"Retrying after {type(e).__name__}")
+        await asyncio.sleep(retry_delay(response, attempt))
+
+
+def stats_tags(body: bytes, encoding: Optional[str]) -> list:
+    """
+    Parse a page with libxml2 and return its STATS_XPATH tags in document order. The
+    body is decoded with the response charset unless that's UTF-8.
+    """
+    try:
+        transcode = encoding is not None and codecs.lookup(encoding).name != 'utf-8'
+    except LookupError:  # Unknown charset label; treat the page as UTF-8
+        transcode = False
+    try:
+        if transcode:
+            return STATS_XPATH(lxml_html.document_fromstring(body.decode(encoding, 'replace')))
+        return STATS_XPATH(lxml_html.document_fromstring(body, parser=UTF8_HTML_PARSER))
+    except etree.ParserError:  # empty document
+        return []
+
+
+def body_report(body: bytes, content_type: str, encoding: Optional[str]) -> list[str]:
+    """Report lines for a 200 body: JSON keys, or the page's JSON-LD, data-events and heading stats."""
+    lines = []
+
+    # Check if JSON
+    if is_json_media_type(content_type):
+        data = orjson.loads(body)
+        lines.append(f"JSON response with {len(data) if isinstance(data, list) else 'object'} items")
+        if isinstance(data, dict):
+            lines.append(f"Keys: {list(data.keys())[:10]}")
+    else:
+        # Look for JSON-LD structured data
+        json_ld = JSONLD_SCRIPT_PATTERN.findall(body)
+        if json_ld:
+            lines.append(f"Found {len(json_ld)} JSON-LD scripts (structured data)")
+            for block in json_ld[:2]:
+                try:
+                    data = orjson.loads(block)
+                    if isinstance(data, dict):
+                        lines.append(f"  Type: {data.get('@type', 'unknown')}")
+                except orjson.JSONDecodeError:
+                    pass
+
+        # Bucket the tags reported below
+        data_attrs, h2s, h3s = [], [], []
+        for tag in stats_tags(body, encoding):
+            if tag.tag == 'h2':
+                h2s.append(tag)
+            elif tag.tag == 'h3':
+                h3s.append(tag)
+            if tag.get('data-events') is not None:
+                data_attrs.append(tag)
+
+        # Look for data attributes
+        lines.append(f"Found {len(data_attrs)} elements with data-events attr")
+
+        # Count headings that might be events
+        lines.append(f"Found {len(h2s)} h2, {len(h3s)} h3 tags")
+
+        # Show some h2/h3 content
+        # normalize-space leaves no newlines, so each heading is exactly one line of the blob
+        blob = "\n".join([NORMALIZED_TEXT_XPATH(h) for h in islice(chain(h2s, h3s), 5)])
+        lines.extend([f"  - {text[:60]}" for text in HEADING_LINE_PATTERN.findall(blob)])
+
+    return lines
+
+
+async def probe(client: httpx.AsyncClient, source: Source) -> list[str]:
+    """Fetch one source and return its report lines, so concurrent probes don't interleave."""
+    lines = [f"\n{BAR}", f"Testing: {source.name}", f"URL: {source.url}", BAR]
+
+    try:
+        validators, previous_report = report_cache.get(source.url, ({}, None))
+        response, body = await fetch(client, source.url, validators, lines)
+        lines.append(f"Status: {response.status_code}")
+        content_type = response.headers.get('content-type', '')
+        lines.append(f"Content-Type: {content_type or 'unknown'}")
+
+        if response.status_code == 304 and previous_report is not None:
+            lines.append("Unchanged since the last probe")
+            lines.extend(previous_report)
+        elif response.status_code == 200:
+            capped = len(body) >= MAX_BODY_BYTES and not is_json_media_type(content_type)
+            truncated = " (truncated)" if capped else ""
+            report = [f"Size: {len(body)} bytes{truncated}"]
+
+            # Parsing is CPU work; run it off the event loop so other probes keep downloading
+            report.extend(await asyncio.to_thread(body_report, body, content_type, response.charset_encoding))
+            lines.extend(report)
+
+            validators = {}
+            if response.headers.get("etag"):
+                validators["If-None-Match"] = response.headers["etag"]
+            if response.headers.get("last-modified"):
+                validators["If-Modified-Since"] = response.headers["last-modified"]
+            if validators:
+                report_cache[source.url] = (validators, report)
+
+    except Exception as e:
+        lines.append(f"Error: {type(e).__name__}: {e}")
+
+    return lines
 
-SOURCES = [
-    ("EverOut API", "https://everout.com/api/events/?location=seattle&page=1"),
-    ("Seattle.gov Calendar", "https://www.seattle.gov/event-calendar/public-outreach-and-engagement-calendar"),
-    ("Visit Seattle", "https://visitseattle.org/events/"),
-    ("Seattle Times", "https://www.seattletimes.com/things-to-do/"),
-    ("Stranger Things To Do", "https://www.thestranger.com/things-to-do"),
-]
 
 async def test_scrape():
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for name, url in SOURCES:
-            print(f"\n{'='*60}")
-            print(f"Testing: {name}")
-            print(f"URL: {url}")
-            print('='*60)
-
-            try:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "text/html,application/json,application/xhtml+xml",
-                }
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                print(f"Status: {response.status_code}")
-                print(f"Content-Type: {response.headers.get('content-type', 'unknown')}")
-
-                if response.status_code == 200:
-                    content = response.text
-                    print(f"Size: {len(content)} bytes")
-
-                    # Check if JSON
-                    if 'json' in response.headers.get('content-type', ''):
-                        data = response.json()
-                        print(f"JSON response with {len(data) if isinstance(data, list) else 'object'} items")
-                        if isinstance(data, dict):
-                            print(f"Keys: {list(data.keys())[:10]}")
-                    else:
-                        soup = BeautifulSoup(content, 'html.parser')
-
-                        # Look for JSON-LD structured data
-                        json_ld = soup.find_all('script', type='application/ld+json')
-                        if json_ld:
-                            print(f"Found {len(json_ld)} JSON-LD scripts (structured data)")
-                            for script in json_ld[:2]:
-                                try:
-                                    data = json.loads(script.string)
-                                    if isinstance(data, dict):
-                                        print(f"  Type: {data.get('@type', 'unknown')}")
-                                except:
-                                    pass
-
-                        # Look for data attributes
-                        data_attrs = soup.find_all(attrs={"data-events": True})
-                        print(f"Found {len(data_attrs)} elements with data-events attr")
-
-                        # Count headings that might be events
-                        h2s = soup.find_all('h2')
-                        h3s = soup.find_all('h3')
-                        print(f"Found {len(h2s)} h2, {len(h3s)} h3 tags")
-
-                        # Show some h2/h3 content
-                        for h in (h2s + h3s)[:5]:
-                            text = h.get_text(strip=True)
-                            if len(text) > 5 and len(text) < 100:
-                                print(f"  - {text[:60]}")
-
-            except Exception as e:
-                print(f"Error: {type(e).__name__}: {e}")
+    # The sources are independent hosts, so probe them all at once; the run takes
+    # as long as the slowest site instead of the sum of all of them
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    async with httpx.AsyncClient(
+        limits=limits, http2=True, timeout=30.0, headers=HTTP_HEADERS, follow_redirects=True
+    ) as client:
+        results = await asyncio.gather(*(probe(client, s) for s in SOURCES), return_exceptions=True)
+
+    for source, result in zip(SOURCES, results):
+        if isinstance(result, BaseException):
+            print(f"\n{source.name}: {type(result).__name__}: {result}")
+        else:
+            print("\n".join(result))
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(test_scrape())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(test_scrape())